@@ -0,0 +1,127 @@
+import asyncio
+from collections import OrderedDict
+import csv
+from pathlib import Path
+import random
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+
+ZIP_CENTROIDS_PATH = Path(__file__).resolve().parent / "us_zip_centroids.csv"
+WARM_ZIPS_PATH = Path(__file__).resolve().parent / "warm_zips.txt"
+
+NOMINATIM_SEARCH_URL = "https://nominatim.openstreetmap.org/search"
+NOMINATIM_USER_AGENT = "fairfix-quote-engine"
+# Nominatim usage policy: at most one request per second.
+NOMINATIM_MIN_INTERVAL = 1.0
+GEOCODE_RETRIES = 3
+GEOCODE_CACHE_SIZE = 10000
+
+Coords = Tuple[float, float]
+
+_geocode_cache: "OrderedDict[str, Optional[Coords]]" = OrderedDict()
+_last_request_at = 0.0
+
+
+def load_zip_centroids(path: Path = ZIP_CENTROIDS_PATH) -> Dict[str, Coords]:
+    """Load a zip -> (lat, lng) table with zip, lat, lng columns, if one is present."""
+    if not path.exists():
+        return {}
+    with open(path, newline="") as f:
+        return {
+            row["zip"].strip(): (float(row["lat"]), float(row["lng"]))
+            for row in csv.DictReader(f)
+        }
+
+
+def load_warm_zips(path: Path = WARM_ZIPS_PATH) -> List[str]:
+    """Load zips to geocode at startup, one per line, if such a list is present."""
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def create_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(timeout=5, headers={"User-Agent": NOMINATIM_USER_AGENT})
+
+
+def _remember(zip_code: str, coords: Optional[Coords]) -> None:
+    _geocode_cache[zip_code] = coords
+    _geocode_cache.move_to_end(zip_code)
+    if len(_geocode_cache) > GEOCODE_CACHE_SIZE:
+        _geocode_cache.popitem(last=False)
+
+
+def _is_transient(exc: httpx.HTTPError) -> bool:
+    """Transport failures, 429 and 5xx are worth retrying; other 4xx won't change."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return True
+
+
+async def _search(client: httpx.AsyncClient, zip_code: str) -> Optional[Coords]:
+    global _last_request_at
+
+    params = {"postalcode": zip_code, "country": "US", "format": "json", "limit": 1}
+    for attempt in range(GEOCODE_RETRIES):
+        wait = _last_request_at + NOMINATIM_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        _last_request_at = time.monotonic()
+        try:
+            response = await client.get(NOMINATIM_SEARCH_URL, params=params)
+            response.raise_for_status()
+            results = response.json()
+            break
+        except ValueError as exc:
+            raise httpx.DecodingError(f"Geocoder returned non-JSON body: {exc}") from exc
+        except httpx.HTTPError as exc:
+            if attempt == GEOCODE_RETRIES - 1 or not _is_transient(exc):
+                raise
+            await asyncio.sleep(0.2 * 2**attempt + random.random() * 0.1)
+
+    try:
+        if not results:
+            return None
+        return float(results[0]["lat"]), float(results[0]["lon"])
+    except (KeyError, IndexError, TypeError, ValueError) as exc:
+        # A 200 we can't read is as unusable as a failed request.
+        raise httpx.DecodingError(f"Unexpected geocoder response: {exc!r}") from exc
+
+
+async def lookup_zip(
+    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, zip_code: str
+) -> Optional[Coords]:
+    """Geocode a zip through Nominatim, one request at a time, caching the answer."""
+    if zip_code in _geocode_cache:
+        _geocode_cache.move_to_end(zip_code)
+        return _geocode_cache[zip_code]
+
+    async with semaphore:
+        # Another request may have resolved this zip while we waited.
+        if zip_code in _geocode_cache:
+            return _geocode_cache[zip_code]
+        coords = await _search(client, zip_code)
+
+    _remember(zip_code, coords)
+    return coords
+
+
+async def batch_geocode(
+    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, zip_codes: Iterable[str]
+) -> Dict[str, Optional[Coords]]:
+    """Resolve many zips (e.g. to warm the cache); duplicates are looked up once."""
+    unique = list(dict.fromkeys(value.strip() for value in zip_codes))
+    tasks = [asyncio.ensure_future(lookup_zip(client, semaphore, value)) for value in unique]
+    try:
+        coords = await asyncio.gather(*tasks)
+    except BaseException:
+        # gather leaves the other lookups running; don't let them outlive the batch.
+        for task in tasks:
+            task.cancel()
+        raise
+    return dict(zip(unique, coords))
@@ -1,17 +1,177 @@
+import asyncio
+from bisect import bisect_left, bisect_right
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
-import random
-from typing import Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from geopy.geocoders import Nominatim
-from sqlmodel import Session, SQLModel, create_engine, select
+from fastapi.staticfiles import StaticFiles
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache
+import httpx
+import numpy as np
+from sqlalchemy import event, literal_column
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from backend.geocoding import (
+    batch_geocode,
+    create_client,
+    load_warm_zips,
+    load_zip_centroids,
+    lookup_zip,
+)
 from backend.models import MaintenanceSchedule, Severity
-from backend_dataset.src.estimator import CostEstimator
+from backend.schemas import (
+    Coordinates,
+    EstimateOut,
+    ForecastResponse,
+    QuoteOut,
+    QuotesResponse,
+    QuoteReq,
+    RecommendReq,
+    ScheduleItem,
+    Vehicle,
+)
+from backend_dataset.src.estimator import BRAKE_PADS_FULL, CostEstimator, CostEstimate
+
+
+DB_PATH = Path(__file__).resolve().parent / "maintenance.db"
+DATASET_FRONTEND_DIR = Path(__file__).resolve().parent.parent / "backend_dataset" / "frontend"
+engine = create_async_engine(
+    f"sqlite+aiosqlite:///{DB_PATH}",
+    pool_size=5,
+    max_overflow=10,
+    pool_recycle=3600,
+)
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+# Forecasts and schedules only depend on their query parameters.
+RESPONSE_CACHE_TTL = 3600
+
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-64000",
+)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
+# (make, model, year) -> (interval_miles ascending, matching severities, fallback position)
+ScheduleIndex = Dict[Tuple[str, str, int], Tuple[Tuple[int, ...], Tuple[Severity, ...], int]]
+
+
+def schedule_db_mtime() -> float:
+    # Writes may sit in the WAL until a checkpoint, so watch both files.
+    wal_path = DB_PATH.with_name(DB_PATH.name + "-wal")
+    return max(path.stat().st_mtime for path in (DB_PATH, wal_path) if path.exists())
+
+
+async def load_schedule_index() -> ScheduleIndex:
+    statement = select(
+        MaintenanceSchedule.make,
+        MaintenanceSchedule.model,
+        MaintenanceSchedule.year,
+        MaintenanceSchedule.interval_miles,
+        MaintenanceSchedule.severity,
+    ).order_by(
+        MaintenanceSchedule.make,
+        MaintenanceSchedule.model,
+        MaintenanceSchedule.year,
+        MaintenanceSchedule.interval_miles,
+        literal_column("rowid"),
+    )
+    async with async_session() as session:
+        rows = (await session.exec(statement)).all()
+
+    grouped: Dict[Tuple[str, str, int], Tuple[list, list]] = {}
+    for make, model, year, interval_miles, severity in rows:
+        intervals, severities = grouped.setdefault((make, model, year), ([], []))
+        intervals.append(interval_miles)
+        severities.append(severity)
+    # When nothing is upcoming the forecast falls back to the first row with the
+    # largest interval; resolve that once here rather than on every request.
+    return {
+        key: (tuple(intervals), tuple(severities), bisect_left(intervals, intervals[-1]))
+        for key, (intervals, severities) in grouped.items()
+    }
+
+
+def query_key_builder(
+    func: Any,
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Tuple[Any, ...] = (),
+    kwargs: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Key cached responses on the query string alone, not on injected dependencies."""
+    query = sorted(request.query_params.multi_items())
+    return f"{namespace}:{request.url.path}:{query}"
+
+
+async def get_schedule_index() -> ScheduleIndex:
+    """Return the startup schedule index, rebuilding it if the database changed (e.g. re-seeded)."""
+    mtime = schedule_db_mtime()
+    if mtime != app.state.sched_mtime:
+        async with app.state.sched_lock:
+            if mtime != app.state.sched_mtime:
+                app.state.sched = await load_schedule_index()
+                app.state.sched_mtime = mtime
+                await FastAPICache.clear(namespace="forecast")
+    return app.state.sched
+
+
+async def warm_geocode_cache(
+    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, zip_codes: List[str]
+) -> None:
+    """Geocode known zips in the background; on failure the rest are just looked up on demand."""
+    with suppress(httpx.HTTPError):
+        await batch_geocode(client, semaphore, zip_codes)
 
 
-app = FastAPI(title="Vehicle Maintenance Intelligence")
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    FastAPICache.init(InMemoryBackend(), prefix="fairfix")
+    app.state.sched_lock = asyncio.Lock()
+    app.state.sched = await load_schedule_index()
+    app.state.sched_mtime = schedule_db_mtime()
+    app.state.estimator = CostEstimator()
+    app.state.zip_centroids = load_zip_centroids()
+    app.state.http = create_client()
+    app.state.geo_sem = asyncio.Semaphore(1)
+    warm_zips = [z for z in load_warm_zips() if z not in app.state.zip_centroids]
+    warmup = None
+    if warm_zips:
+        # Nominatim allows 1 req/s, so don't hold startup for the whole list.
+        warmup = asyncio.create_task(
+            warm_geocode_cache(app.state.http, app.state.geo_sem, warm_zips)
+        )
+    yield
+    if warmup is not None:
+        warmup.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup
+    await app.state.http.aclose()
+    await engine.dispose()
+
+
+app = FastAPI(title="Vehicle Maintenance Intelligence", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -19,12 +179,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-DB_PATH = Path(__file__).resolve().parent / "maintenance.db"
-engine = create_engine(f"sqlite:///{DB_PATH}")
-SQLModel.metadata.create_all(engine)
+_rng = np.random.default_rng()
+
 
-estimator = CostEstimator()
-geocoder = Nominatim(user_agent="fairfix-quote-engine")
+# Lower-cased request spelling -> estimator service name.
+SERVICE_ALIASES = {
+    "oil change": "Oil Change",
+    "battery replacement": "Battery Replacement",
+    "tire rotation": "Tire Rotation",
+    "spark plug service": "Spark Plug Replacement (4-cyl)",
+    "brake pad replacement": BRAKE_PADS_FULL,
+    "brake pads": BRAKE_PADS_FULL,
+    "brakes": BRAKE_PADS_FULL,
+    "brake pads full": BRAKE_PADS_FULL,
+}
+
+# Fallback price bands for services the estimator doesn't know.
+SERVICE_PRICE_BANDS = {
+    "oil change": (60, 140),
+    "brake pad replacement": (220, 520),
+    "battery replacement": (120, 280),
+    "tire rotation": (40, 120),
+    "spark plug service": (180, 420),
+}
+
+
+async def geocode_zip(value: str) -> Tuple[float, float]:
+    zip_code = value.strip()
+    coords = app.state.zip_centroids.get(zip_code)
+    if coords is None:
+        try:
+            coords = await lookup_zip(app.state.http, app.state.geo_sem, zip_code)
+        except httpx.HTTPError:
+            raise HTTPException(status_code=503, detail="Geocoding service unavailable.")
+    if coords is None:
+        raise HTTPException(status_code=404, detail="Unable to locate that zip code.")
+    return coords
 
 
 def estimate_cost(severity: Severity) -> int:
@@ -35,62 +225,84 @@ def estimate_cost(severity: Severity) -> int:
     return 800
 
 
-@app.get("/maintenance-forecast")
-def maintenance_forecast(
+def shop_quotes(
+    names: List[str],
+    prices: np.ndarray,
+    shop_type: str,
+    distance_range: Tuple[float, float],
+    user_lat: float,
+    user_lng: float,
+) -> List[QuoteOut]:
+    """Place each shop near the user, drawing all jitter for the group in one go."""
+    count = len(names)
+    distances = _rng.uniform(*distance_range, count).round(1)
+    lats = (user_lat + _rng.uniform(-0.02, 0.02, count)).round(6)
+    lngs = (user_lng + _rng.uniform(-0.02, 0.02, count)).round(6)
+    return [
+        QuoteOut(
+            name=name,
+            price=price,
+            type=shop_type,
+            distance=distance,
+            lat=lat,
+            lng=lng,
+        )
+        for name, price, distance, lat, lng in zip(
+            names,
+            prices.round().astype(int).tolist(),
+            distances.tolist(),
+            lats.tolist(),
+            lngs.tolist(),
+        )
+    ]
+
+
+@app.get("/maintenance-forecast", response_model=ForecastResponse)
+@cache(expire=RESPONSE_CACHE_TTL, namespace="forecast", key_builder=query_key_builder)
+async def maintenance_forecast(
     make: str = Query(..., min_length=1),
     model: str = Query(..., min_length=1),
     year: int = Query(..., ge=1900),
     current_mileage: int = Query(..., ge=0),
+    schedule_index: ScheduleIndex = Depends(get_schedule_index),
 ):
-    with Session(engine) as session:
-        statement = select(MaintenanceSchedule).where(
-            MaintenanceSchedule.make == make,
-            MaintenanceSchedule.model == model,
-            MaintenanceSchedule.year == year,
-        )
-        schedules = session.exec(statement).all()
+    # The index dependency runs before the cache lookup, so a re-seed clears stale entries.
+    schedules = schedule_index.get((make, model, year))
 
     if not schedules:
         raise HTTPException(status_code=404, detail="No schedule found for that vehicle.")
 
-    upcoming = sorted(
-        (item for item in schedules if item.interval_miles > current_mileage),
-        key=lambda item: item.interval_miles,
-    )
-    if not upcoming:
-        next_service = max(schedules, key=lambda item: item.interval_miles)
-    else:
-        next_service = upcoming[0]
+    intervals, severities, fallback = schedules
+    index = bisect_right(intervals, current_mileage)
+    if index == len(intervals):
+        index = fallback
+    next_interval = intervals[index]
 
-    overdue = current_mileage > next_service.interval_miles + 500
+    overdue = current_mileage > next_interval + 500
     status = "Overdue" if overdue else "Good"
 
-    miles_until = max(next_service.interval_miles - current_mileage, 0)
+    miles_until = max(next_interval - current_mileage, 0)
 
     return {
         "status": status,
-        "next_service_due_at": next_service.interval_miles,
+        "next_service_due_at": next_interval,
         "miles_until_service": miles_until,
-        "estimated_cost": estimate_cost(next_service.severity),
+        "estimated_cost": estimate_cost(severities[index]),
     }
 
-@app.get("/schedule")
-def schedule(
+@app.get("/schedule", response_model=List[ScheduleItem])
+@cache(expire=RESPONSE_CACHE_TTL, namespace="schedule", key_builder=query_key_builder)
+async def schedule(
     make: str = Query(..., min_length=1),
     model: str = Query(..., min_length=1),
     year: int = Query(..., ge=1900),
     mileage: int = Query(..., ge=0),
 ):
-    recommendations = estimator.recommend_services(make, model, mileage)
-    if not recommendations:
+    estimator = app.state.estimator
+    if not estimator.has_schedule(make, model):
         raise HTTPException(status_code=404, detail="No schedule found for that vehicle.")
 
-    upper_bound = mileage + 5000
-    due_soon = [
-        item
-        for item in recommendations
-        if mileage <= item.mileage_interval <= upper_bound
-    ]
+    due_soon = estimator.recommend_due_soon(make, model, mileage, window=5000)
 
     return [
         {
@@ -103,35 +315,23 @@ def schedule(
     ]
 
 
-@app.get("/quotes")
-def quotes(
+@app.get("/quotes", response_model=QuotesResponse)
+async def quotes(
     service_name: str = Query(..., min_length=1),
     make: str = Query(..., min_length=1),
     model: str = Query(..., min_length=1),
     year: int = Query(..., ge=1900),
     zip_code: str = Query(..., min_length=3),
 ):
-    def geocode_zip(value: str) -> Tuple[float, float]:
-        location = geocoder.geocode({"postalcode": value, "country": "US"})
-        if not location:
-            raise HTTPException(status_code=404, detail="Unable to locate that zip code.")
-        return location.latitude, location.longitude
-
-    user_lat, user_lng = geocode_zip(zip_code)
-    normalized_service = service_name.strip().lower()
-    service_lookup = {
-        "oil change": "Oil Change",
-        "battery replacement": "Battery Replacement",
-        "tire rotation": "Tire Rotation",
-        "spark plug service": "Spark Plug Replacement (4-cyl)",
-    }
+    user_lat, user_lng = await geocode_zip(zip_code)
+    stripped_service = service_name.strip()
+    normalized_service = stripped_service.lower()
+    canonical_service = SERVICE_ALIASES.get(normalized_service, stripped_service)
 
-    estimate = None
-    if normalized_service in {"brake pad replacement", "brake pads"}:
-        estimate = estimator.estimate_brakes_full(make, model, year)
+    if canonical_service == BRAKE_PADS_FULL:
+        estimate = app.state.estimator.estimate_brakes_full(make, model, year)
     else:
-        mapped_service = service_lookup.get(service_name.strip().lower(), service_name.strip())
-        estimate = estimator.estimate(make, model, year, mapped_service)
+        estimate = app.state.estimator.estimate(make, model, year, canonical_service)
 
     dealer_names = [
         f"{make.title()} {model.title()} Authorized Dealer",
@@ -143,83 +343,114 @@ def quotes(
         "Precision Auto Care",
     ]
 
-    quotes_list = []
     if estimate:
-        dealer_low, dealer_high = estimate.dealer.total_ci_low, estimate.dealer.total_ci_high
-        indy_low, indy_high = estimate.indy.total_ci_low, estimate.indy.total_ci_high
-        for name in dealer_names:
-            price = round(random.uniform(dealer_low, dealer_high))
-            shop_lat = user_lat + random.uniform(-0.02, 0.02)
-            shop_lng = user_lng + random.uniform(-0.02, 0.02)
-            quotes_list.append(
-                {
-                    "name": name,
-                    "price": price,
-                    "type": "Dealer",
-                    "distance": round(random.uniform(2.0, 15.0), 1),
-                    "lat": round(shop_lat, 6),
-                    "lng": round(shop_lng, 6),
-                }
-            )
-
-        for name in indy_names:
-            price = round(random.uniform(indy_low, indy_high))
-            shop_lat = user_lat + random.uniform(-0.02, 0.02)
-            shop_lng = user_lng + random.uniform(-0.02, 0.02)
-            quotes_list.append(
-                {
-                    "name": name,
-                    "price": price,
-                    "type": "Indy",
-                    "distance": round(random.uniform(1.0, 12.0), 1),
-                    "lat": round(shop_lat, 6),
-                    "lng": round(shop_lng, 6),
-                }
-            )
+        dealer_prices = _rng.uniform(
+            estimate.dealer.total_ci_low, estimate.dealer.total_ci_high, len(dealer_names)
+        )
+        indy_prices = _rng.uniform(
+            estimate.indy.total_ci_low, estimate.indy.total_ci_high, len(indy_names)
+        )
     else:
-        service_price_bands = {
-            "oil change": (60, 140),
-            "brake pad replacement": (220, 520),
-            "battery replacement": (120, 280),
-            "tire rotation": (40, 120),
-            "spark plug service": (180, 420),
-        }
-        low, high = service_price_bands.get(normalized_service, (200, 550))
-        base_price = random.randint(low, high)
-
-        for name in dealer_names:
-            price = round(base_price * 1.4)
-            shop_lat = user_lat + random.uniform(-0.02, 0.02)
-            shop_lng = user_lng + random.uniform(-0.02, 0.02)
-            quotes_list.append(
-                {
-                    "name": name,
-                    "price": price,
-                    "type": "Dealer",
-                    "distance": round(random.uniform(2.0, 15.0), 1),
-                    "lat": round(shop_lat, 6),
-                    "lng": round(shop_lng, 6),
-                }
-            )
-
-        for name in indy_names:
-            price = round(base_price * random.uniform(0.75, 0.95))
-            shop_lat = user_lat + random.uniform(-0.02, 0.02)
-            shop_lng = user_lng + random.uniform(-0.02, 0.02)
-            quotes_list.append(
-                {
-                    "name": name,
-                    "price": price,
-                    "type": "Indy",
-                    "distance": round(random.uniform(1.0, 12.0), 1),
-                    "lat": round(shop_lat, 6),
-                    "lng": round(shop_lng, 6),
-                }
-            )
+        low, high = SERVICE_PRICE_BANDS.get(normalized_service, (200, 550))
+        base_price = _rng.integers(low, high, endpoint=True)
+        dealer_prices = np.full(len(dealer_names), base_price * 1.4)
+        indy_prices = base_price * _rng.uniform(0.75, 0.95, len(indy_names))
+
+    quotes_list = shop_quotes(
+        dealer_names, dealer_prices, "Dealer", (2.0, 15.0), user_lat, user_lng
+    ) + shop_quotes(indy_names, indy_prices, "Indy", (1.0, 12.0), user_lat, user_lng)
+
+    return QuotesResponse(
+        service=service_name,
+        vehicle=Vehicle(make=make, model=model, year=year),
+        center=Coordinates(lat=round(user_lat, 6), lng=round(user_lng, 6)),
+        quotes=quotes_list,
+    )
+
+
+def estimate_out(est: Optional[CostEstimate]) -> Optional[EstimateOut]:
+    """Wrap a CostEstimate so its CI bounds are rounded at serialization."""
+    if est is None:
+        return None
+    return EstimateOut.model_validate(est)
 
+
+@app.get("/api/services")
+async def api_services():
+    """List available services."""
+    services = sorted(app.state.estimator._labor_standards.keys())
+    return {"services": services}
+
+
+@app.post("/api/quote")
+async def api_quote(req: QuoteReq):
+    """Get cost quote for year, make, model, service."""
+    make, model = req.make, req.model
+    service = SERVICE_ALIASES.get(req.service.strip().lower(), req.service)
+    estimator = app.state.estimator
+    if service == BRAKE_PADS_FULL:
+        result = estimator.estimate_brakes_full(make, model, req.year)
+    else:
+        result = estimator.estimate(make, model, req.year, service)
+
+    if not result:
+        raise HTTPException(status_code=400, detail="Unknown service")
+
+    response = {
+        "make": result.make,
+        "model": result.model,
+        "year": result.year,
+        "service": result.service,
+        "vehicle_tier": result.vehicle_tier,
+        "labor_hours": result.labor_hours,
+        "dealer": estimate_out(result.dealer),
+        "indy": estimate_out(result.indy),
+        "indy_savings_ci_low": round(result.indy_savings_ci_low, 0),
+        "indy_savings_ci_high": round(result.indy_savings_ci_high, 0),
+    }
+
+    if req.mileage is not None:
+        recs = estimator.recommend_services(make, model, req.mileage)
+        response["recommended_services"] = [
+            {"service_name": r.service_name, "mileage_interval": r.mileage_interval, "due_now": r.due_now}
+            for r in recs
+        ]
+
+    return response
+
+
+@app.post("/api/recommend")
+async def api_recommend(req: RecommendReq):
+    """Recommend services based on year, make, model, mileage."""
+    make, model = req.make, req.model
+    recs = app.state.estimator.recommend_services(make, model, req.mileage)
     return {
-        "service": service_name,
-        "vehicle": {"make": make, "model": model, "year": year},
-        "center": {"lat": round(user_lat, 6), "lng": round(user_lng, 6)},
-        "quotes": quotes_list,
+        "make": make,
+        "model": model,
+        "year": req.year,
+        "mileage": req.mileage,
+        "services": [
+            {"service_name": r.service_name, "mileage_interval": r.mileage_interval, "due_now": r.due_now}
+            for r in recs
+        ],
     }
+
+
+# Mounted last so the API routes above take precedence over static files.
+if DATASET_FRONTEND_DIR.is_dir():
+    app.mount("/", StaticFiles(directory=DATASET_FRONTEND_DIR, html=True), name="frontend")
+
+if __name__ == "__main__":
+    import os
+
+    import uvicorn
+
+    uvicorn.run(
+        "backend.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+        access_log=False,
+    )
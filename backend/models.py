@@ -1,6 +1,7 @@
 from enum import Enum
 from typing import Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -12,6 +13,7 @@ class Severity(str, Enum):
 
 class MaintenanceSchedule(SQLModel, table=True):
     __tablename__ = "maintenance_schedule"
+    __table_args__ = (Index("ix_msched_make_model_year", "make", "model", "year"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     make: str
@@ -27,7 +29,7 @@ class ServiceHistory(SQLModel, table=True):
     __tablename__ = "service_history"
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    vehicle_id: str
+    vehicle_id: str = Field(index=True)
     date: str
     mileage: int
     shop_name: str
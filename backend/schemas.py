@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 class ReceiptData(BaseModel):
@@ -9,3 +9,86 @@ class ReceiptData(BaseModel):
     mileage_in: int = Field(..., ge=0)
     services_performed: List[str] = Field(..., min_length=1)
     total_cost: float = Field(..., ge=0)
+
+
+class ForecastResponse(BaseModel):
+    status: str
+    next_service_due_at: int
+    miles_until_service: int
+    estimated_cost: int
+
+
+class ScheduleItem(BaseModel):
+    service_task: str
+    interval_miles: int
+    description: str
+    severity: str
+
+
+class Vehicle(BaseModel):
+    make: str
+    model: str
+    year: int
+
+
+class Coordinates(BaseModel):
+    lat: float
+    lng: float
+
+
+class QuoteOut(BaseModel):
+    name: str
+    price: int
+    type: Literal["Dealer", "Indy"]
+    distance: float
+    lat: float
+    lng: float
+
+
+class QuotesResponse(BaseModel):
+    service: str
+    vehicle: Vehicle
+    center: Coordinates
+    quotes: List[QuoteOut]
+
+
+class QuoteReq(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    year: int = Field(..., ge=1900)
+    make: str = Field(..., min_length=1)
+    model: str = Field(..., min_length=1)
+    service: str = Field(..., min_length=1)
+    mileage: Optional[int] = Field(default=None, ge=0)
+
+
+class RecommendReq(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    year: int = Field(..., ge=1900)
+    make: str = Field(..., min_length=1)
+    model: str = Field(..., min_length=1)
+    mileage: int = Field(..., gt=0)
+
+
+class EstimateOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    shop_type: str
+    total_ci_low: float
+    total_ci_high: float
+    labor_cost_ci_low: float
+    labor_cost_ci_high: float
+    parts_ci_low: float
+    parts_ci_high: float
+
+    @field_serializer(
+        "total_ci_low",
+        "total_ci_high",
+        "labor_cost_ci_low",
+        "labor_cost_ci_high",
+        "parts_ci_low",
+        "parts_ci_high",
+    )
+    def _round(self, value: float) -> float:
+        return round(value, 0)
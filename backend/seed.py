@@ -1,9 +1,24 @@
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+from sqlalchemy import text
 from sqlmodel import SQLModel, create_engine
 
-from backend.models import MaintenanceSchedule
+from backend.models import MaintenanceSchedule, ServiceHistory
+
+SQLITE_MAX_VARIABLES = 999
+
+CSV_DTYPES = {
+    "make": "string",
+    "model": "string",
+    "category": "string",
+    "year": "int32",
+    "interval_miles": "int32",
+    "interval_months": "float64",
+    "service_category": "string",
+    "description": "string",
+}
 
 
 def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -33,16 +48,13 @@ def ensure_required_columns(df: pd.DataFrame) -> pd.DataFrame:
         df["service_task"] = df["service_category"]
 
     if "severity" not in df.columns:
-        def infer_severity(value: str) -> str:
-            text = str(value).lower()
-            if "critical" in text:
-                return "Critical"
-            if "major" in text:
-                return "Major"
-            return "Routine"
-
         basis = df["service_task"] if "service_task" in df.columns else df["description"]
-        df["severity"] = basis.map(infer_severity)
+        text = basis.astype(str).str.lower()
+        df["severity"] = np.select(
+            [text.str.contains("critical", regex=False), text.str.contains("major", regex=False)],
+            ["Critical", "Major"],
+            default="Routine",
+        )
 
     return df
 
@@ -50,11 +62,6 @@ def ensure_required_columns(df: pd.DataFrame) -> pd.DataFrame:
 def apply_rules(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
 
-    df["year"] = pd.to_numeric(df["year"], errors="coerce").fillna(0).astype(int)
-    df["interval_miles"] = (
-        pd.to_numeric(df["interval_miles"], errors="coerce").fillna(0).astype(int)
-    )
-
     ghost_mask = (df["model"] == "TRX") & (df["year"] < 2021)
     df = df.loc[~ghost_mask].reset_index(drop=True)
 
@@ -66,26 +73,20 @@ def apply_rules(df: pd.DataFrame) -> pd.DataFrame:
     df.loc[oil_mask, "interval_miles"] = 10000
     df.loc[oil_mask, "description"] = "Synthetic Oil Change"
 
-    trx_years = sorted(df.loc[df["model"] == "TRX", "year"].unique().tolist())
-    if trx_years:
-        trx_rows = df.loc[df["model"] == "TRX"]
-        trx_make_by_year = (
-            trx_rows.groupby("year")["make"].first().to_dict() if not trx_rows.empty else {}
+    trx_new = (
+        df.loc[df["model"] == "TRX"]
+        .groupby("year", as_index=False)["make"]
+        .first()
+        .assign(
+            model="TRX",
+            interval_miles=15000,
+            service_task="Diff Fluid Check",
+            description="Inspect Front/Rear Axle Fluid & Transfer Case (High Performance)",
+            severity="Critical",
         )
-        injected_rows = []
-        for year in trx_years:
-            injected_rows.append(
-                {
-                    "make": trx_make_by_year.get(year, "Ram"),
-                    "model": "TRX",
-                    "year": int(year),
-                    "interval_miles": 15000,
-                    "service_task": "Diff Fluid Check",
-                    "description": "Inspect Front/Rear Axle Fluid & Transfer Case (High Performance)",
-                    "severity": "Critical",
-                }
-            )
-        df = pd.concat([df, pd.DataFrame(injected_rows)], ignore_index=True)
+    )
+    if not trx_new.empty:
+        df = pd.concat([df, trx_new], ignore_index=True)
 
     return df
 
@@ -96,7 +97,8 @@ def main() -> None:
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV not found at {csv_path}")
 
-    df = pd.read_csv(csv_path)
+    # year/interval_miles are typed at parse time, so apply_rules can compare them directly.
+    df = pd.read_csv(csv_path, engine="pyarrow", dtype=CSV_DTYPES)
     df = normalize_columns(df)
     df = ensure_required_columns(df)
     validate_columns(df)
@@ -106,7 +108,36 @@ def main() -> None:
     engine = create_engine(f"sqlite:///{db_path}")
     SQLModel.metadata.create_all(engine)
 
-    df.to_sql(MaintenanceSchedule.__tablename__, engine, if_exists="replace", index=False)
+    # Multi-row INSERTs, kept under SQLite's default 999 bound-parameter limit.
+    chunksize = max(1, SQLITE_MAX_VARIABLES // len(df.columns))
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+        # A failed seed is simply re-run, so skip fsyncs for the bulk load.
+        conn.exec_driver_sql("PRAGMA synchronous=OFF")
+        df.to_sql(
+            MaintenanceSchedule.__tablename__,
+            conn,
+            if_exists="replace",
+            index=False,
+            method="multi",
+            chunksize=chunksize,
+        )
+        # to_sql(if_exists="replace") drops the table, taking its indexes with it.
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_msched_make_model_year "
+                f"ON {MaintenanceSchedule.__tablename__} (make, model, year)"
+            )
+        )
+        # create_all never adds indexes to a service_history that already exists.
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_service_history_vehicle_id "
+                f"ON {ServiceHistory.__tablename__} (vehicle_id)"
+            )
+        )
+        conn.commit()
+        conn.exec_driver_sql("PRAGMA synchronous=NORMAL")
     print(f"Seeded {len(df)} rows into {db_path}")
 
 
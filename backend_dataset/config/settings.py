@@ -1,6 +1,8 @@
 """Pipeline configuration and settings."""
 
 import os
+from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 import yaml
 from dotenv import load_dotenv
@@ -23,13 +25,23 @@ for d in [DATA_DIR, RAW_DIR, PROCESSED_DIR, OUTPUT_DIR, LOG_DIR]:
 # NHTSA API (free, no key required)
 NHTSA_BASE_URL = os.getenv("NHTSA_BASE_URL", "https://api.nhtsa.gov")
 
+# On-disk HTTP response cache for the scrapers (used when requests-cache is installed)
+HTTP_CACHE_PATH = Path(os.getenv("HTTP_CACHE_PATH", DATA_DIR / "http_cache.sqlite"))
+HTTP_CACHE_TTL = timedelta(hours=int(os.getenv("HTTP_CACHE_TTL_HOURS", "24")))
+
+# Pipeline export format: "feather" (default), "parquet" or "csv"
+EXPORT_FORMAT = os.getenv("FAIRFIX_EXPORT_FMT", "feather")
+# Result lists longer than this are exported in chunks of this many records
+EXPORT_CHUNK_ROWS = int(os.getenv("FAIRFIX_EXPORT_CHUNK_ROWS", "50000"))
+
 # Rate limits
 DEFAULT_RATE_LIMIT = 60
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DATA_DIR}/pipeline.db")
 
 
+@lru_cache(maxsize=1)
 def load_sources_config() -> dict:
-    """Load source configuration from YAML."""
+    """Load source configuration from YAML (parsed once per process; treat the result as read-only)."""
     config_path = Path(__file__).parent / "sources.yaml"
     with open(config_path) as f:
         return yaml.safe_load(f)
@@ -24,11 +24,15 @@ Usage:
   # Labor standards only
   python run_test.py pipeline --skip-oem --skip-dealer --skip-parts --skip-recalls
 
+  # Write CSV instead of Feather (or set FAIRFIX_EXPORT_FMT=csv|parquet)
+  python run_test.py pipeline --vehicles "Toyota,Camry,2020" --format csv
+
   # Cost estimate (all data from code reference files)
   python run_test.py estimate --make Toyota --model Camry --year 2020 --service "Oil Change"
   python run_test.py estimate --make BMW --model M3 --year 2023 --service "Oil Change"
   python run_test.py estimate --make Toyota --model Camry --year 2012 --brakes  # front+rear pads
   python run_test.py estimate --list-services
+  python run_test.py estimate --batch quotes.csv  # CSV columns: make,model,year,service
 
   # Quote: year, make, model, service (+ optional mileage for recommended services)
   python run_test.py quote --year 2020 --make Honda --model Civic --service "Oil Change"
@@ -40,11 +44,20 @@ Usage:
 
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 
+@lru_cache(maxsize=1)
+def get_estimator():
+    """CostEstimator shared by the estimate/quote/recommend handlers."""
+    from src.estimator import CostEstimator
+
+    return CostEstimator()
+
+
 def run_recalls(args):
     from src.ingesters.recalls import RecallsIngester
 
@@ -95,14 +108,13 @@ def run_pipeline(args):
         skip_labor=args.skip_labor,
         skip_parts=args.skip_parts,
         skip_recalls=args.skip_recalls,
+        export_format=args.format,
     )
     print("\nDone. Outputs in data/output/")
 
 
 def run_estimate(args):
-    from src.estimator import CostEstimator
-
-    est = CostEstimator()
+    est = get_estimator()
 
     if args.list_services:
         print("Available services (from code reference data):")
@@ -110,6 +122,10 @@ def run_estimate(args):
             print(f"  - {svc}")
         return
 
+    if args.batch:
+        run_estimate_batch(est, args.batch)
+        return
+
     if not (args.make and args.model and args.year):
         print("Provide --make --model --year (and --service or --brakes)")
         return
@@ -141,15 +157,37 @@ def run_estimate(args):
     print("\n(All values from code: data/reference/*.csv, ranges are 95% confidence intervals)")
 
 
+def run_estimate_batch(est, path):
+    """Estimate every make,model,year,service row of a CSV file."""
+    import csv
+
+    with open(path, newline="") as f:
+        requests = [
+            (row["make"].strip(), row["model"].strip(), int(row["year"]), row["service"].strip())
+            for row in csv.DictReader(f)
+        ]
+
+    results = est.estimate_batch(requests)
+    print(f"{'Vehicle':<32} {'Service':<34} {'Dealer (95% CI)':>17} {'Indy (95% CI)':>17}")
+    print("-" * 103)
+    for (make, model, year, service), result in zip(requests, results):
+        vehicle = f"{year} {make} {model}"
+        if not result:
+            print(f"{vehicle:<32} {service:<34} {'unknown service':>35}")
+            continue
+        dealer = f"${result.dealer.total_ci_low:.0f}-{result.dealer.total_ci_high:.0f}"
+        indy = f"${result.indy.total_ci_low:.0f}-{result.indy.total_ci_high:.0f}"
+        print(f"{vehicle:<32} {service:<34} {dealer:>17} {indy:>17}")
+    print(f"\n{sum(r is not None for r in results)}/{len(results)} rows estimated")
+
+
 def run_quote(args):
     """Get a quote: year, make, model, service. With mileage, show recommended services."""
-    from src.estimator import CostEstimator
-
     if not (args.year and args.make and args.model and args.service):
         print("Provide --year --make --model --service (--mileage optional)")
         return
 
-    est = CostEstimator()
+    est = get_estimator()
 
     # Show recommended services when mileage provided
     if args.mileage is not None:
@@ -193,13 +231,11 @@ def run_quote(args):
 
 def run_recommend(args):
     """Recommend services based on year, make, model, mileage."""
-    from src.estimator import CostEstimator
-
     if not (args.year and args.make and args.model and args.mileage is not None):
         print("Provide --year --make --model --mileage")
         return
 
-    est = CostEstimator()
+    est = get_estimator()
     recs = est.recommend_services(args.make, args.model, args.mileage)
     due = [r for r in recs if r.due_now]
     coming = [r for r in recs if not r.due_now]
@@ -220,11 +256,7 @@ def run_recommend(args):
     print(f"\n(Intervals from data/reference/maintenance_intervals*.csv)")
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Test the auto maintenance pipeline")
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
-    # recalls
+def add_recalls_parser(subparsers):
     rp = subparsers.add_parser("recalls", help="Run recalls lookup only")
     rp.add_argument("--vin", help="VIN to check")
     rp.add_argument("--make", help="Make (with --model --year)")
@@ -233,7 +265,8 @@ def main():
     rp.add_argument("--vehicles", nargs="+", help='e.g. "Toyota,Camry,2020" "Honda,Accord,2019"')
     rp.set_defaults(func=run_recalls)
 
-    # pipeline
+
+def add_pipeline_parser(subparsers):
     pp = subparsers.add_parser("pipeline", help="Run full pipeline")
     pp.add_argument("--vins", nargs="+", help="VINs for recalls")
     pp.add_argument("--vehicles", nargs="+", help='e.g. "Toyota,Camry,2020"')
@@ -244,9 +277,12 @@ def main():
     pp.add_argument("--skip-labor", action="store_true")
     pp.add_argument("--skip-parts", action="store_true")
     pp.add_argument("--skip-recalls", action="store_true")
+    pp.add_argument("--format", choices=("feather", "parquet", "csv"),
+                    help="Output format (default: $FAIRFIX_EXPORT_FMT or feather)")
     pp.set_defaults(func=run_pipeline)
 
-    # estimate
+
+def add_estimate_parser(subparsers):
     ep = subparsers.add_parser("estimate", help="Cost estimate (all data from code)")
     ep.add_argument("--make", help="Make (e.g. Toyota, BMW)")
     ep.add_argument("--model", help="Model (e.g. Camry, M3)")
@@ -254,9 +290,11 @@ def main():
     ep.add_argument("--service", help="Service name (see --list-services)")
     ep.add_argument("--brakes", action="store_true", help="Brake pads front+rear")
     ep.add_argument("--list-services", action="store_true", help="List available services")
+    ep.add_argument("--batch", help="CSV file with make,model,year,service columns")
     ep.set_defaults(func=run_estimate)
 
-    # quote
+
+def add_quote_parser(subparsers):
     qp = subparsers.add_parser("quote", help="Get quote: year, make, model, service (+ mileage for recommended services)")
     qp.add_argument("--year", type=int, required=True, help="Year (e.g. 2020)")
     qp.add_argument("--make", required=True, help="Make (e.g. Honda, Toyota)")
@@ -265,7 +303,8 @@ def main():
     qp.add_argument("--service", required=True, help="Service name (see estimate --list-services)")
     qp.set_defaults(func=run_quote)
 
-    # recommend
+
+def add_recommend_parser(subparsers):
     rp = subparsers.add_parser("recommend", help="Recommend services based on mileage")
     rp.add_argument("--year", type=int, required=True, help="Year (e.g. 2020)")
     rp.add_argument("--make", required=True, help="Make (e.g. Honda, Toyota)")
@@ -273,7 +312,28 @@ def main():
     rp.add_argument("--mileage", type=int, required=True, help="Current mileage")
     rp.set_defaults(func=run_recommend)
 
-    args = parser.parse_args()
+
+COMMANDS = {
+    "recalls": add_recalls_parser,
+    "pipeline": add_pipeline_parser,
+    "estimate": add_estimate_parser,
+    "quote": add_quote_parser,
+    "recommend": add_recommend_parser,
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(description="Test the auto maintenance pipeline")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Only build the chosen subcommand; register all for --help or an unknown command
+    command = argv[0] if argv else None
+    for name, add_parser in COMMANDS.items():
+        if command not in COMMANDS or name == command:
+            add_parser(subparsers)
+
+    args = parser.parse_args(argv)
     args.func(args)
 
 
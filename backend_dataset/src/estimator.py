@@ -2,7 +2,7 @@
 Cost Estimator - Produces dollar estimates from code data only.
 
 Uses:
-- Labor hours (from labor_standards)
+- Labor hours (from data/reference/labor_standards.csv)
 - Labor rates (from data/reference/labor_rates.csv) - rate_mean, rate_std
 - Parts estimates (from data/reference/parts_estimates.csv) - parts_mean, parts_std
 - Vehicle tier (from data/reference/vehicle_tiers.csv)
@@ -13,9 +13,24 @@ Price ranges are 95% confidence intervals (mean ± 1.96 * std).
 
 import csv
 import math
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from datetime import date
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional
+from types import MappingProxyType
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from operator import itemgetter
+from typing import Iterator, Optional
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; estimate_batch falls back to NumPy
+    njit = None
+    prange = range
 
 # 95% confidence interval multiplier (z-score for normal distribution)
 Z_95 = 1.96
@@ -23,8 +38,252 @@ Z_95 = 1.96
 # Project root for imports
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# Front + rear pads are quoted as one visit under this label
+BRAKE_PADS_FULL = "Brake Pads (Front + Rear)"
+BRAKE_PAD_SERVICES = ("Brake Pad Replacement (Front)", "Brake Pad Replacement (Rear)")
+
+# Max distinct (vehicle, year, service) estimates memoized per CostEstimator
+ESTIMATE_CACHE_SIZE = 4096
+
+# Current year for the age discount: [year, monotonic time it was read].
+# Refreshed hourly so long-running servers pick up the new year.
+_CURRENT_YEAR_TTL = 3600.0
+_CURRENT_YEAR_CACHE = [date.today().year, time.monotonic()]
+
+
+def _current_year() -> int:
+    now = time.monotonic()
+    if now - _CURRENT_YEAR_CACHE[1] > _CURRENT_YEAR_TTL:
+        _CURRENT_YEAR_CACHE[0] = date.today().year
+        _CURRENT_YEAR_CACHE[1] = now
+    return _CURRENT_YEAR_CACHE[0]
+
+
+# Reference CSV loaders. Each is cached per reference directory so repeated
+# CostEstimator() construction reuses the parsed tables instead of re-reading
+# the CSVs. The returned dicts are shared between instances and never mutated.
+
+def _norm(name: str) -> str:
+    """Lookup form of a make/model: stripped, lower-cased and interned."""
+    return sys.intern(name.strip().lower())
+
+
+def _read_columns(path: Path, *columns: str) -> Iterator[tuple[str, ...]]:
+    """Yield the named columns of each CSV row, located once from the header."""
+    with open(path) as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        pick = itemgetter(*(header.index(c) for c in columns))
+        for row in reader:
+            if row:
+                yield pick(row)
+
+
+def _read_table(path: Path) -> np.ndarray:
+    """Whole CSV as a structured array: text columns as str, numeric columns as float64."""
+    return np.genfromtxt(path, delimiter=",", names=True, dtype=None, encoding="utf-8", ndmin=1)
 
-@dataclass
+
+@lru_cache(maxsize=None)
+def _load_labor_standards(ref_dir: Path) -> MappingProxyType:
+    """service -> labor hours (read-only, shared by all instances)."""
+    rows = _read_columns(ref_dir / "labor_standards.csv", "service_name", "hours")
+    return MappingProxyType({sys.intern(svc): float(hours) for svc, hours in rows})
+
+
+@dataclass(frozen=True)
+class _RateTables:
+    """
+    Labor rates and parts estimates as dense arrays indexed by small int ids.
+    The last row/column of each axis is the fallback slot for names missing
+    from the CSVs: rate (100, 10), parts (0, 0).
+    """
+    tier_id: dict[str, int]
+    shop_id: dict[str, int]
+    service_id: dict[str, int]
+    rate_mean: np.ndarray  # [tier, shop]
+    rate_std: np.ndarray  # [tier, shop]
+    parts_mean: np.ndarray  # [service, tier]
+    parts_std: np.ndarray  # [service, tier]
+
+
+@lru_cache(maxsize=None)
+def _load_rate_tables(ref_dir: Path) -> _RateTables:
+    """Parse labor_rates.csv and parts_estimates.csv into _RateTables."""
+    # Numeric columns are parsed by NumPy in C rather than float() per cell
+    rates = _read_table(ref_dir / "labor_rates.csv")
+    parts = _read_table(ref_dir / "parts_estimates.csv")
+    rate_tiers, rate_shops = rates["vehicle_tier"].tolist(), rates["shop_type"].tolist()
+    parts_services, parts_tiers = parts["service_name"].tolist(), parts["vehicle_tier"].tolist()
+
+    tier_id: dict[str, int] = {}
+    shop_id: dict[str, int] = {}
+    service_id: dict[str, int] = {}
+    for tier in rate_tiers + parts_tiers:
+        tier_id.setdefault(sys.intern(tier), len(tier_id))
+    for shop in rate_shops:
+        shop_id.setdefault(sys.intern(shop), len(shop_id))
+    for service in parts_services:
+        service_id.setdefault(sys.intern(service), len(service_id))
+
+    def ids(names: list[str], mapping: dict[str, int]) -> np.ndarray:
+        return np.fromiter((mapping[name] for name in names), dtype=np.intp, count=len(names))
+
+    rate_mean = np.full((len(tier_id) + 1, len(shop_id) + 1), 100.0)
+    rate_std = np.full_like(rate_mean, 10.0)
+    rate_idx = (ids(rate_tiers, tier_id), ids(rate_shops, shop_id))
+    rate_mean[rate_idx] = rates["rate_mean"]
+    rate_std[rate_idx] = rates["rate_std"]
+
+    parts_mean = np.zeros((len(service_id) + 1, len(tier_id) + 1))
+    parts_std = np.zeros_like(parts_mean)
+    parts_idx = (ids(parts_services, service_id), ids(parts_tiers, tier_id))
+    parts_mean[parts_idx] = parts["parts_mean"]
+    parts_std[parts_idx] = parts["parts_std"]
+
+    return _RateTables(tier_id, shop_id, service_id, rate_mean, rate_std, parts_mean, parts_std)
+
+
+@lru_cache(maxsize=None)
+def _load_maintenance_intervals(ref_dir: Path) -> dict[tuple[str, str], dict[str, int]]:
+    """(make, model) -> {service: miles}, make/model specific."""
+    intervals: dict[tuple[str, str], dict[str, int]] = {}
+    rows = _read_columns(ref_dir / "maintenance_intervals.csv", "make", "model", "service_name", "mileage_interval")
+    for make, model, svc, miles in rows:
+        intervals.setdefault((_norm(make), _norm(model)), {})[sys.intern(svc.strip())] = int(miles)
+    return intervals
+
+
+@lru_cache(maxsize=None)
+def _load_maintenance_intervals_tier(ref_dir: Path) -> dict[str, dict[str, int]]:
+    """tier -> {service: miles}, used when no make/model interval exists."""
+    intervals: dict[str, dict[str, int]] = {}
+    rows = _read_columns(ref_dir / "maintenance_intervals_tier.csv", "vehicle_tier", "service_name", "mileage_interval")
+    for tier, svc, miles in rows:
+        intervals.setdefault(sys.intern(tier.strip()), {})[sys.intern(svc.strip())] = int(miles)
+    return intervals
+
+
+@lru_cache(maxsize=None)
+def _load_vehicle_tiers(ref_dir: Path) -> tuple[dict[tuple[str, str], str], dict[str, str]]:
+    """((make, model) -> tier, make -> first listed tier)."""
+    vehicle_tiers: dict[tuple[str, str], str] = {}
+    make_tiers: dict[str, str] = {}
+    for make, model, tier in _read_columns(ref_dir / "vehicle_tiers.csv", "make", "model", "tier"):
+        mk, md, tier = _norm(make), _norm(model), sys.intern(tier.strip())
+        vehicle_tiers[(mk, md)] = tier
+        if mk not in make_tiers:
+            make_tiers[mk] = tier
+    return vehicle_tiers, make_tiers
+
+
+def _shop_columns_numpy(
+    labor_hours: np.ndarray, rate_mean: np.ndarray, rate_std: np.ndarray, parts_mean: np.ndarray, parts_std: np.ndarray
+) -> np.ndarray:
+    """
+    Per-shop batch columns, shape (10, n):
+    rate CI low/high, labor mean/std/CI low/high, total mean/std/CI low/high.
+    """
+    labor_mean = labor_hours * rate_mean
+    labor_std = labor_hours * rate_std
+    total_mean = labor_mean + parts_mean
+    total_std = np.hypot(labor_std, parts_std)
+    rate_z, labor_z, total_z = Z_95 * rate_std, Z_95 * labor_std, Z_95 * total_std
+    return np.stack((
+        np.maximum(0.0, rate_mean - rate_z), rate_mean + rate_z,
+        labor_mean, labor_std, np.maximum(0.0, labor_mean - labor_z), labor_mean + labor_z,
+        total_mean, total_std, np.maximum(0.0, total_mean - total_z), total_mean + total_z,
+    ))
+
+
+def _shop_columns_loop(
+    labor_hours: np.ndarray, rate_mean: np.ndarray, rate_std: np.ndarray, parts_mean: np.ndarray, parts_std: np.ndarray
+) -> np.ndarray:
+    """Same as _shop_columns_numpy as one fused loop, for numba to compile."""
+    n = labor_hours.shape[0]
+    out = np.empty((10, n))
+    for i in prange(n):
+        labor_mean = labor_hours[i] * rate_mean[i]
+        labor_std = labor_hours[i] * rate_std[i]
+        total_mean = labor_mean + parts_mean[i]
+        total_std = math.hypot(labor_std, parts_std[i])
+        rate_z = Z_95 * rate_std[i]
+        labor_z = Z_95 * labor_std
+        total_z = Z_95 * total_std
+        out[0, i] = max(0.0, rate_mean[i] - rate_z)
+        out[1, i] = rate_mean[i] + rate_z
+        out[2, i] = labor_mean
+        out[3, i] = labor_std
+        out[4, i] = max(0.0, labor_mean - labor_z)
+        out[5, i] = labor_mean + labor_z
+        out[6, i] = total_mean
+        out[7, i] = total_std
+        out[8, i] = max(0.0, total_mean - total_z)
+        out[9, i] = total_mean + total_z
+    return out
+
+
+# fastmath is left off so batch results stay consistent with estimate()
+_shop_columns = (
+    njit(parallel=True, cache=True)(_shop_columns_loop) if njit is not None else _shop_columns_numpy
+)
+
+
+def _ci_from_z(mean: float, z: float) -> tuple[float, float]:
+    """CI bounds from a precomputed half-width z = Z_95 * std (lower bound clamped at 0)."""
+    ci_low = mean - z
+    return (ci_low if ci_low > 0 else 0.0), mean + z
+
+
+def _resolve_tier(
+    vehicle_tiers: dict[tuple[str, str], str], make_tiers: dict[str, str], mk: str, md: str
+) -> str:
+    """Tier for a lower-cased make/model. Fallback: make only, then 'mid'."""
+    tier = vehicle_tiers.get((mk, md))
+    if tier is None:
+        tier = make_tiers.get(mk, "mid")
+    return tier
+
+
+@dataclass(frozen=True)
+class _Schedule:
+    """Effective maintenance intervals for one vehicle (or tier fallback)."""
+    items: tuple[tuple[str, int], ...]  # (service, miles) sorted by service
+    miles: tuple[int, ...]  # ascending
+    services: tuple[str, ...]  # aligned with miles
+
+
+def _make_schedule(intervals: dict[str, int]) -> _Schedule:
+    by_miles = sorted((miles, svc) for svc, miles in intervals.items())
+    return _Schedule(
+        items=tuple(sorted(intervals.items())),
+        miles=tuple(miles for miles, _ in by_miles),
+        services=tuple(svc for _, svc in by_miles),
+    )
+
+
+_EMPTY_SCHEDULE = _make_schedule({})
+
+
+@lru_cache(maxsize=None)
+def _load_schedules(ref_dir: Path) -> tuple[dict[tuple[str, str], _Schedule], dict[str, _Schedule]]:
+    """
+    Merged interval schedules: ((make, model) -> _Schedule, tier -> _Schedule).
+    Make/model intervals override the vehicle's tier intervals service by service.
+    """
+    specific = _load_maintenance_intervals(ref_dir)
+    by_tier = _load_maintenance_intervals_tier(ref_dir)
+    vehicle_tiers, make_tiers = _load_vehicle_tiers(ref_dir)
+
+    tier_schedules = {tier: _make_schedule(intervals) for tier, intervals in by_tier.items()}
+    vehicle_schedules: dict[tuple[str, str], _Schedule] = {}
+    for (mk, md), intervals in specific.items():
+        tier = _resolve_tier(vehicle_tiers, make_tiers, mk, md)
+        vehicle_schedules[(mk, md)] = _make_schedule({**by_tier.get(tier, {}), **intervals})
+    return vehicle_schedules, tier_schedules
+
+
+@dataclass(slots=True, frozen=True)
 class CostEstimate:
     """Single cost estimate (dealer or indy) with 95% CI."""
     shop_type: str
@@ -48,8 +307,36 @@ class CostEstimate:
     total_ci_low: float
     total_ci_high: float
 
+    @classmethod
+    def from_primitives(
+        cls,
+        shop_type: str,
+        tier: str,
+        service: str,
+        labor_hours: float,
+        rate_mean: float,
+        rate_std: float,
+        labor_mean: float,
+        labor_std: float,
+        parts_mean: float,
+        parts_std: float,
+        total_mean: float,
+        total_std: float,
+        parts_ci: Optional[tuple[float, float]] = None,
+    ) -> "CostEstimate":
+        """Build from means/stds, deriving the CI bounds; parts_ci may be passed in when shared."""
+        if parts_ci is None:
+            parts_ci = _ci_from_z(parts_mean, Z_95 * parts_std)
+        return cls(
+            shop_type, tier, service, labor_hours,
+            rate_mean, rate_std, *_ci_from_z(rate_mean, Z_95 * rate_std),
+            labor_mean, labor_std, *_ci_from_z(labor_mean, Z_95 * labor_std),
+            parts_mean, parts_std, *parts_ci,
+            total_mean, total_std, *_ci_from_z(total_mean, Z_95 * total_std),
+        )
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RecommendedService:
     """Service recommended based on mileage interval."""
     service_name: str
@@ -57,7 +344,7 @@ class RecommendedService:
     due_now: bool  # True if current mileage >= interval
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EstimateResult:
     """Full estimate result with dealer and indy (95% CI)."""
     make: str
@@ -80,95 +367,29 @@ class CostEstimator:
 
     def __init__(self):
         self.ref_dir = PROJECT_ROOT / "data" / "reference"
-        self._labor_standards: dict[str, float] = {}
-        self._labor_rates: dict[tuple[str, str], tuple[float, float]] = {}  # (shop, tier) -> (mean, std)
-        self._parts_estimates: dict[tuple[str, str], tuple[float, float]] = {}  # (service, tier) -> (mean, std)
+        self._labor_standards: MappingProxyType = MappingProxyType({})  # service -> hours
+        self._rates: Optional[_RateTables] = None  # labor rates [tier, shop] and parts [service, tier]
         self._vehicle_tiers: dict[tuple[str, str], str] = {}
         self._make_tiers: dict[str, str] = {}
-        self._maintenance_intervals: dict[tuple[str, str], dict[str, int]] = {}  # (make, model) -> {service: miles}
-        self._maintenance_intervals_tier: dict[str, dict[str, int]] = {}  # tier -> {service: miles}
+        self._vehicle_schedules: dict[tuple[str, str], _Schedule] = {}  # merged make/model + tier intervals, presorted
+        self._tier_schedules: dict[str, _Schedule] = {}
+        self._estimate_cached = lru_cache(maxsize=ESTIMATE_CACHE_SIZE)(self._estimate_normalized)
         self._load_reference_data()
 
     def _load_reference_data(self):
-        """Load all reference data from CSV files."""
-        # Labor standards
-        labor_ops = [
-            ("Oil Change", 0.5),
-            ("Transmission Fluid Change", 0.75),
-            ("Brake Fluid Change", 0.5),
-            ("Air Filter", 0.25),
-            ("Cabin Air Filter", 0.25),
-            ("TPMS Sensor", 0.5),
-            ("Brake Pad Replacement (Front)", 1.5),
-            ("Brake Pad Replacement (Rear)", 1.0),
-            ("Brake Rotor Replacement (Front)", 1.0),
-            ("Brake Rotor Replacement (Rear)", 1.0),
-            ("Alternator Replacement", 1.5),
-            ("Starter Replacement", 1.0),
-            ("Battery Replacement", 0.25),
-            ("Spark Plug Replacement (4-cyl)", 1.0),
-            ("Spark Plug Replacement (6-cyl)", 1.5),
-            ("Spark Plug Replacement (8-cyl)", 2.0),
-            ("Timing Belt Replacement", 4.0),
-            ("Water Pump Replacement", 2.5),
-            ("Thermostat Replacement", 1.0),
-            ("Radiator Replacement", 3.0),
-            ("AC Recharge", 0.5),
-            ("Compressor Replacement", 3.0),
-            ("Tire Rotation", 0.25),
-            ("Wheel Alignment", 1.0),
-            ("Strut Replacement (Front)", 2.0),
-            ("Strut Replacement (Rear)", 1.5),
-        ]
-        self._labor_standards = dict(labor_ops)
-
-        # Labor rates (mean, std)
-        with open(self.ref_dir / "labor_rates.csv") as f:
-            for row in csv.DictReader(f):
-                key = (row["shop_type"], row["vehicle_tier"])
-                self._labor_rates[key] = (float(row["rate_mean"]), float(row["rate_std"]))
-
-        # Parts estimates (mean, std)
-        with open(self.ref_dir / "parts_estimates.csv") as f:
-            for row in csv.DictReader(f):
-                key = (row["service_name"], row["vehicle_tier"])
-                self._parts_estimates[key] = (float(row["parts_mean"]), float(row["parts_std"]))
-
-        # Maintenance intervals (make/model specific)
-        with open(self.ref_dir / "maintenance_intervals.csv") as f:
-            for row in csv.DictReader(f):
-                make, model = row["make"].strip().lower(), row["model"].strip().lower()
-                svc, miles = row["service_name"].strip(), int(row["mileage_interval"])
-                key = (make, model)
-                if key not in self._maintenance_intervals:
-                    self._maintenance_intervals[key] = {}
-                self._maintenance_intervals[key][svc] = miles
-
-        # Maintenance intervals (tier fallback)
-        with open(self.ref_dir / "maintenance_intervals_tier.csv") as f:
-            for row in csv.DictReader(f):
-                tier, svc, miles = row["vehicle_tier"].strip(), row["service_name"].strip(), int(row["mileage_interval"])
-                if tier not in self._maintenance_intervals_tier:
-                    self._maintenance_intervals_tier[tier] = {}
-                self._maintenance_intervals_tier[tier][svc] = miles
-
-        # Vehicle tiers
-        with open(self.ref_dir / "vehicle_tiers.csv") as f:
-            for row in csv.DictReader(f):
-                make, model = row["make"].strip(), row["model"].strip()
-                tier = row["tier"].strip()
-                self._vehicle_tiers[(make.lower(), model.lower())] = tier
-                if make.lower() not in self._make_tiers:
-                    self._make_tiers[make.lower()] = tier
+        """Load all reference data from CSV files (parsed once per process)."""
+        self._labor_standards = _load_labor_standards(self.ref_dir)
+        self._rates = _load_rate_tables(self.ref_dir)
+        self._vehicle_tiers, self._make_tiers = _load_vehicle_tiers(self.ref_dir)
+        self._vehicle_schedules, self._tier_schedules = _load_schedules(self.ref_dir)
 
     def get_vehicle_tier(self, make: str, model: str) -> str:
         """Resolve vehicle tier from make/model. Fallback: make only, then 'mid'."""
-        mk, md = make.strip().lower(), model.strip().lower()
-        if (mk, md) in self._vehicle_tiers:
-            return self._vehicle_tiers[(mk, md)]
-        if mk in self._make_tiers:
-            return self._make_tiers[mk]
-        return "mid"
+        return self.get_vehicle_tier_lc(_norm(make), _norm(model))
+
+    def get_vehicle_tier_lc(self, mk: str, md: str) -> str:
+        """get_vehicle_tier for make/model already normalized with _norm."""
+        return _resolve_tier(self._vehicle_tiers, self._make_tiers, mk, md)
 
     def get_labor_hours(self, service: str) -> Optional[float]:
         """Get labor hours for service. Returns None if unknown."""
@@ -176,11 +397,30 @@ class CostEstimator:
 
     def get_labor_rates(self, tier: str, shop_type: str) -> tuple[float, float]:
         """Get labor rate (mean, std) for tier and shop type."""
-        return self._labor_rates.get((shop_type, tier), (100.0, 10.0))
+        rates = self._rates
+        i = rates.tier_id.get(tier, -1)
+        j = rates.shop_id.get(shop_type, -1)
+        return float(rates.rate_mean[i, j]), float(rates.rate_std[i, j])
 
     def get_parts_estimate(self, service: str, tier: str) -> tuple[float, float]:
         """Get parts cost (mean, std) for service and tier."""
-        return self._parts_estimates.get((service, tier), (0.0, 0.0))
+        rates = self._rates
+        i = rates.service_id.get(service, -1)
+        j = rates.tier_id.get(tier, -1)
+        return float(rates.parts_mean[i, j]), float(rates.parts_std[i, j])
+
+    def _schedule_for(self, make: str, model: str) -> _Schedule:
+        """Make/model schedule when one exists, else the vehicle tier's."""
+        mk, md = _norm(make), _norm(model)
+        schedule = self._vehicle_schedules.get((mk, md))
+        if schedule is None:
+            tier = _resolve_tier(self._vehicle_tiers, self._make_tiers, mk, md)
+            schedule = self._tier_schedules.get(tier, _EMPTY_SCHEDULE)
+        return schedule
+
+    def has_schedule(self, make: str, model: str) -> bool:
+        """True if any maintenance interval applies to this vehicle."""
+        return bool(self._schedule_for(make, model).items)
 
     def recommend_services(
         self, make: str, model: str, mileage: int
@@ -190,125 +430,115 @@ class CostEstimator:
         Uses make/model-specific intervals when available, else tier fallback.
         Returns services where mileage >= interval (due_now=True) or coming up.
         """
-        mk, md = make.strip().lower(), model.strip().lower()
-        tier = self.get_vehicle_tier(make, model)
-
-        # Get interval map: make/model specific first, then tier fallback
-        intervals: dict[str, int] = {}
-        if (mk, md) in self._maintenance_intervals:
-            intervals = self._maintenance_intervals[(mk, md)].copy()
-        if tier in self._maintenance_intervals_tier:
-            for svc, miles in self._maintenance_intervals_tier[tier].items():
-                if svc not in intervals:
-                    intervals[svc] = miles
-
-        results: list[RecommendedService] = []
-        for svc, interval in sorted(intervals.items()):
-            due_now = mileage >= interval
-            results.append(RecommendedService(
-                service_name=svc,
-                mileage_interval=interval,
-                due_now=due_now,
-            ))
-        return results
+        return [
+            RecommendedService(service_name=svc, mileage_interval=interval, due_now=mileage >= interval)
+            for svc, interval in self._schedule_for(make, model).items
+        ]
+
+    def recommend_due_soon(
+        self, make: str, model: str, mileage: int, window: int = 5000
+    ) -> list[RecommendedService]:
+        """
+        Services whose interval falls within [mileage, mileage + window],
+        ordered by service name like recommend_services.
+        """
+        schedule = self._schedule_for(make, model)
+        i = bisect_left(schedule.miles, mileage)
+        j = bisect_right(schedule.miles, mileage + window)
+        hits = sorted(zip(schedule.services[i:j], schedule.miles[i:j]))
+        return [
+            RecommendedService(service_name=svc, mileage_interval=interval, due_now=mileage >= interval)
+            for svc, interval in hits
+        ]
+
+    def recommend_batch(
+        self, requests: list[tuple[str, str, int]]
+    ) -> list[list[RecommendedService]]:
+        """recommend_services for many (make, model, mileage) tuples."""
+        return [self.recommend_services(make, model, mileage) for make, model, mileage in requests]
 
     def _apply_year_discount(self, rate_mean: float, rate_std: float, year: int, shop_type: str) -> tuple[float, float]:
         """Apply year-based discount for older vehicles at indy shops."""
-        from datetime import datetime
-        current_year = datetime.now().year
-        age = current_year - year
-        if shop_type == "indy" and age >= 10:
-            discount = 0.9
-            return (rate_mean * discount, rate_std * discount)
-        return (rate_mean, rate_std)
-
-    def _ci_bounds(self, mean: float, std: float) -> tuple[float, float]:
-        """Compute 95% CI bounds."""
-        ci_low = max(0, mean - Z_95 * std)
-        ci_high = mean + Z_95 * std
-        return (ci_low, ci_high)
+        age = _current_year() - year
+        discount = 0.9 if (shop_type == "indy" and age >= 10) else 1.0
+        return (rate_mean * discount, rate_std * discount)
 
-    def estimate(
+    def _shop_estimate(
+        self,
+        shop_type: str,
+        tier: str,
+        service: str,
+        labor_hours: float,
+        rate_mean: float,
+        rate_std: float,
+        labor_mean: float,
+        labor_var: float,
+        parts_mean: float,
+        parts_std: float,
+        parts_ci: tuple[float, float],
+    ) -> CostEstimate:
+        """
+        Build one shop's CostEstimate from aggregated means and variances.
+        Parts do not depend on the shop, so their std and CI come in precomputed.
+        """
+        labor_std = math.sqrt(labor_var)
+        return CostEstimate.from_primitives(
+            shop_type, tier, service, labor_hours,
+            rate_mean, rate_std, labor_mean, labor_std, parts_mean, parts_std,
+            labor_mean + parts_mean, math.hypot(labor_std, parts_std),
+            parts_ci=parts_ci,
+        )
+
+    def _estimate_services(
         self,
         make: str,
         model: str,
         year: int,
-        service: str,
+        services: list[str],
+        label: Optional[str] = None,
     ) -> Optional[EstimateResult]:
         """
-        Produce cost estimate from code data only.
-        Returns EstimateResult with dealer and indy estimates (95% CI), or None if service unknown.
+        Estimate one or more services done in a single visit.
+        Services are treated as independent: means and variances are summed,
+        and CI bounds are computed once on the aggregates.
+        make/model must already be normalized with _norm (see _estimate_memo).
+        Returns None if any service is unknown.
         """
-        labor_hours = self.get_labor_hours(service)
-        if labor_hours is None:
-            return None
-
-        tier = self.get_vehicle_tier(make, model)
+        tier = self.get_vehicle_tier_lc(make, model)
 
         # Labor rates (mean, std)
         dealer_mean, dealer_std = self.get_labor_rates(tier, "dealer")
         indy_mean, indy_std = self.get_labor_rates(tier, "indy")
         indy_mean, indy_std = self._apply_year_discount(indy_mean, indy_std, year, "indy")
 
-        # Parts (mean, std)
-        parts_mean, parts_std = self.get_parts_estimate(service, tier)
-
-        # Dealer estimate
-        dealer_labor_mean = labor_hours * dealer_mean
-        dealer_labor_std = labor_hours * dealer_std
-        dealer_total_mean = dealer_labor_mean + parts_mean
-        dealer_total_std = math.sqrt(dealer_labor_std ** 2 + parts_std ** 2)
-
-        dealer_est = CostEstimate(
-            shop_type="dealer",
-            vehicle_tier=tier,
-            service=service,
-            labor_hours=labor_hours,
-            labor_rate_mean=dealer_mean,
-            labor_rate_std=dealer_std,
-            labor_rate_ci_low=self._ci_bounds(dealer_mean, dealer_std)[0],
-            labor_rate_ci_high=self._ci_bounds(dealer_mean, dealer_std)[1],
-            labor_cost_mean=dealer_labor_mean,
-            labor_cost_std=dealer_labor_std,
-            labor_cost_ci_low=self._ci_bounds(dealer_labor_mean, dealer_labor_std)[0],
-            labor_cost_ci_high=self._ci_bounds(dealer_labor_mean, dealer_labor_std)[1],
-            parts_mean=parts_mean,
-            parts_std=parts_std,
-            parts_ci_low=self._ci_bounds(parts_mean, parts_std)[0],
-            parts_ci_high=self._ci_bounds(parts_mean, parts_std)[1],
-            total_mean=dealer_total_mean,
-            total_std=dealer_total_std,
-            total_ci_low=self._ci_bounds(dealer_total_mean, dealer_total_std)[0],
-            total_ci_high=self._ci_bounds(dealer_total_mean, dealer_total_std)[1],
+        labor_hours = 0.0
+        dealer_labor_mean = dealer_labor_var = 0.0
+        indy_labor_mean = indy_labor_var = 0.0
+        parts_mean = parts_var = 0.0
+        for service in services:
+            hours = self.get_labor_hours(service)
+            if hours is None:
+                return None
+            svc_parts_mean, svc_parts_std = self.get_parts_estimate(service, tier)
+
+            labor_hours += hours
+            dealer_labor_mean += hours * dealer_mean
+            dealer_labor_var += (hours * dealer_std) ** 2
+            indy_labor_mean += hours * indy_mean
+            indy_labor_var += (hours * indy_std) ** 2
+            parts_mean += svc_parts_mean
+            parts_var += svc_parts_std ** 2
+
+        service_name = label or services[0]
+        parts_std = math.sqrt(parts_var)
+        parts_ci = _ci_from_z(parts_mean, Z_95 * parts_std)
+        dealer_est = self._shop_estimate(
+            "dealer", tier, service_name, labor_hours,
+            dealer_mean, dealer_std, dealer_labor_mean, dealer_labor_var, parts_mean, parts_std, parts_ci,
         )
-
-        # Indy estimate
-        indy_labor_mean = labor_hours * indy_mean
-        indy_labor_std = labor_hours * indy_std
-        indy_total_mean = indy_labor_mean + parts_mean
-        indy_total_std = math.sqrt(indy_labor_std ** 2 + parts_std ** 2)
-
-        indy_est = CostEstimate(
-            shop_type="indy",
-            vehicle_tier=tier,
-            service=service,
-            labor_hours=labor_hours,
-            labor_rate_mean=indy_mean,
-            labor_rate_std=indy_std,
-            labor_rate_ci_low=self._ci_bounds(indy_mean, indy_std)[0],
-            labor_rate_ci_high=self._ci_bounds(indy_mean, indy_std)[1],
-            labor_cost_mean=indy_labor_mean,
-            labor_cost_std=indy_labor_std,
-            labor_cost_ci_low=self._ci_bounds(indy_labor_mean, indy_labor_std)[0],
-            labor_cost_ci_high=self._ci_bounds(indy_labor_mean, indy_labor_std)[1],
-            parts_mean=parts_mean,
-            parts_std=parts_std,
-            parts_ci_low=self._ci_bounds(parts_mean, parts_std)[0],
-            parts_ci_high=self._ci_bounds(parts_mean, parts_std)[1],
-            total_mean=indy_total_mean,
-            total_std=indy_total_std,
-            total_ci_low=self._ci_bounds(indy_total_mean, indy_total_std)[0],
-            total_ci_high=self._ci_bounds(indy_total_mean, indy_total_std)[1],
+        indy_est = self._shop_estimate(
+            "indy", tier, service_name, labor_hours,
+            indy_mean, indy_std, indy_labor_mean, indy_labor_var, parts_mean, parts_std, parts_ci,
         )
 
         savings_ci_low = dealer_est.total_ci_low - indy_est.total_ci_high
@@ -318,7 +548,7 @@ class CostEstimator:
             make=make,
             model=model,
             year=year,
-            service=service,
+            service=service_name,
             vehicle_tier=tier,
             labor_hours=labor_hours,
             dealer=dealer_est,
@@ -327,78 +557,142 @@ class CostEstimator:
             indy_savings_ci_high=max(0, savings_ci_high),
         )
 
+    def _estimate_normalized(
+        self,
+        mk: str,
+        md: str,
+        year: int,
+        services: tuple[str, ...],
+        label: Optional[str],
+        current_year: int,
+    ) -> Optional[EstimateResult]:
+        """Cache target; current_year is only part of the key so the age discount rolls over."""
+        return self._estimate_services(mk, md, year, list(services), label)
+
+    def _estimate_memo(
+        self,
+        make: str,
+        model: str,
+        year: int,
+        services: tuple[str, ...],
+        label: Optional[str] = None,
+    ) -> Optional[EstimateResult]:
+        """
+        Memoized _estimate_services keyed on lower-cased make/model.
+        Results are frozen, so hits are shared; the caller's spelling of
+        make/model is restored on the returned copy.
+        """
+        mk, md = _norm(make), _norm(model)
+        result = self._estimate_cached(mk, md, year, services, label, _current_year())
+        if result is None or (make == mk and model == md):
+            return result
+        return replace(result, make=make, model=model)
+
+    def estimate(
+        self,
+        make: str,
+        model: str,
+        year: int,
+        service: str,
+    ) -> Optional[EstimateResult]:
+        """
+        Produce cost estimate from code data only.
+        Returns EstimateResult with dealer and indy estimates (95% CI), or None if service unknown.
+        """
+        return self._estimate_memo(make, model, year, (service,))
+
     def estimate_brakes_full(self, make: str, model: str, year: int) -> Optional[EstimateResult]:
         """Estimate front + rear brake pad replacement (combined)."""
-        front = self.estimate(make, model, year, "Brake Pad Replacement (Front)")
-        rear = self.estimate(make, model, year, "Brake Pad Replacement (Rear)")
-        if not front or not rear:
-            return None
-
-        tier = front.vehicle_tier
-        labor_hours = front.labor_hours + rear.labor_hours
-
-        # Combine means and variances (independent)
-        dealer_total_mean = front.dealer.total_mean + rear.dealer.total_mean
-        dealer_total_std = math.sqrt(front.dealer.total_std ** 2 + rear.dealer.total_std ** 2)
-        indy_total_mean = front.indy.total_mean + rear.indy.total_mean
-        indy_total_std = math.sqrt(front.indy.total_std ** 2 + rear.indy.total_std ** 2)
-
-        dealer = CostEstimate(
-            shop_type="dealer",
-            vehicle_tier=tier,
-            service="Brake Pads (Front + Rear)",
-            labor_hours=labor_hours,
-            labor_rate_mean=front.dealer.labor_rate_mean,
-            labor_rate_std=front.dealer.labor_rate_std,
-            labor_rate_ci_low=front.dealer.labor_rate_ci_low,
-            labor_rate_ci_high=front.dealer.labor_rate_ci_high,
-            labor_cost_mean=front.dealer.labor_cost_mean + rear.dealer.labor_cost_mean,
-            labor_cost_std=math.sqrt(front.dealer.labor_cost_std**2 + rear.dealer.labor_cost_std**2),
-            labor_cost_ci_low=front.dealer.labor_cost_ci_low + rear.dealer.labor_cost_ci_low,
-            labor_cost_ci_high=front.dealer.labor_cost_ci_high + rear.dealer.labor_cost_ci_high,
-            parts_mean=front.dealer.parts_mean + rear.dealer.parts_mean,
-            parts_std=math.sqrt(front.dealer.parts_std**2 + rear.dealer.parts_std**2),
-            parts_ci_low=front.dealer.parts_ci_low + rear.dealer.parts_ci_low,
-            parts_ci_high=front.dealer.parts_ci_high + rear.dealer.parts_ci_high,
-            total_mean=dealer_total_mean,
-            total_std=dealer_total_std,
-            total_ci_low=self._ci_bounds(dealer_total_mean, dealer_total_std)[0],
-            total_ci_high=self._ci_bounds(dealer_total_mean, dealer_total_std)[1],
-        )
-        indy = CostEstimate(
-            shop_type="indy",
-            vehicle_tier=tier,
-            service="Brake Pads (Front + Rear)",
-            labor_hours=labor_hours,
-            labor_rate_mean=front.indy.labor_rate_mean,
-            labor_rate_std=front.indy.labor_rate_std,
-            labor_rate_ci_low=front.indy.labor_rate_ci_low,
-            labor_rate_ci_high=front.indy.labor_rate_ci_high,
-            labor_cost_mean=front.indy.labor_cost_mean + rear.indy.labor_cost_mean,
-            labor_cost_std=math.sqrt(front.indy.labor_cost_std**2 + rear.indy.labor_cost_std**2),
-            labor_cost_ci_low=front.indy.labor_cost_ci_low + rear.indy.labor_cost_ci_low,
-            labor_cost_ci_high=front.indy.labor_cost_ci_high + rear.indy.labor_cost_ci_high,
-            parts_mean=front.indy.parts_mean + rear.indy.parts_mean,
-            parts_std=math.sqrt(front.indy.parts_std**2 + rear.indy.parts_std**2),
-            parts_ci_low=front.indy.parts_ci_low + rear.indy.parts_ci_low,
-            parts_ci_high=front.indy.parts_ci_high + rear.indy.parts_ci_high,
-            total_mean=indy_total_mean,
-            total_std=indy_total_std,
-            total_ci_low=self._ci_bounds(indy_total_mean, indy_total_std)[0],
-            total_ci_high=self._ci_bounds(indy_total_mean, indy_total_std)[1],
-        )
-        savings_ci_low = dealer.total_ci_low - indy.total_ci_high
-        savings_ci_high = dealer.total_ci_high - indy.total_ci_low
+        return self._estimate_memo(make, model, year, BRAKE_PAD_SERVICES, label=BRAKE_PADS_FULL)
 
-        return EstimateResult(
-            make=make,
-            model=model,
-            year=year,
-            service="Brake Pads (Front + Rear)",
-            vehicle_tier=tier,
-            labor_hours=labor_hours,
-            dealer=dealer,
-            indy=indy,
-            indy_savings_ci_low=max(0, savings_ci_low),
-            indy_savings_ci_high=max(0, savings_ci_high),
-        )
+    def estimate_batch(
+        self, requests: list[tuple[str, str, int, str]]
+    ) -> list[Optional[EstimateResult]]:
+        """
+        estimate() for many (make, model, year, service) tuples.
+        Lookups are resolved per row, the arithmetic runs once over NumPy
+        arrays, and dataclasses are built at the end. Unknown services yield None.
+        """
+        results: list[Optional[EstimateResult]] = [None] * len(requests)
+        rates = self._rates
+        rows: list[int] = []
+        tiers: list[str] = []
+        hours: list[float] = []
+        years: list[int] = []
+        service_ids: list[int] = []
+        for i, (make, model, year, service) in enumerate(requests):
+            labor_hours = self.get_labor_hours(service)
+            if labor_hours is None:
+                continue
+            rows.append(i)
+            tiers.append(self.get_vehicle_tier(make, model))
+            hours.append(labor_hours)
+            years.append(year)
+            service_ids.append(rates.service_id.get(service, -1))
+        if not rows:
+            return results
+
+        tier_ids = np.fromiter((rates.tier_id.get(t, -1) for t in tiers), dtype=np.intp, count=len(tiers))
+        dealer_id = rates.shop_id.get("dealer", -1)
+        indy_id = rates.shop_id.get("indy", -1)
+        labor_hours = np.asarray(hours, dtype=np.float64)
+        dealer_mean = rates.rate_mean[tier_ids, dealer_id]
+        dealer_std = rates.rate_std[tier_ids, dealer_id]
+        indy_mean = rates.rate_mean[tier_ids, indy_id]
+        indy_std = rates.rate_std[tier_ids, indy_id]
+        parts_mean = rates.parts_mean[service_ids, tier_ids]
+        parts_std = rates.parts_std[service_ids, tier_ids]
+
+        # Same rule as _apply_year_discount, applied to the whole batch
+        discount = np.where(_current_year() - np.asarray(years) >= 10, 0.9, 1.0)
+        indy_mean = indy_mean * discount
+        indy_std = indy_std * discount
+
+        shops = {}
+        for shop_type, rate_mean, rate_std in (
+            ("dealer", dealer_mean, dealer_std),
+            ("indy", indy_mean, indy_std),
+        ):
+            (
+                rate_lo, rate_hi, labor_mean, labor_std, labor_lo, labor_hi,
+                total_mean, total_std, total_lo, total_hi,
+            ) = _shop_columns(labor_hours, rate_mean, rate_std, parts_mean, parts_std).tolist()
+            shops[shop_type] = (
+                rate_mean.tolist(), rate_std.tolist(), (rate_lo, rate_hi),
+                labor_mean, labor_std, (labor_lo, labor_hi),
+                total_mean, total_std, (total_lo, total_hi),
+            )
+        parts_z = Z_95 * parts_std
+        parts_mean_l, parts_std_l = parts_mean.tolist(), parts_std.tolist()
+        parts_ci_low = np.maximum(0.0, parts_mean - parts_z).tolist()
+        parts_ci_high = (parts_mean + parts_z).tolist()
+
+        for k, i in enumerate(rows):
+            make, model, year, service = requests[i]
+            estimates = {}
+            for shop_type, (
+                rate_mean, rate_std, (rate_lo, rate_hi),
+                labor_mean, labor_std, (labor_lo, labor_hi),
+                total_mean, total_std, (total_lo, total_hi),
+            ) in shops.items():
+                estimates[shop_type] = CostEstimate(
+                    shop_type, tiers[k], service, hours[k],
+                    rate_mean[k], rate_std[k], rate_lo[k], rate_hi[k],
+                    labor_mean[k], labor_std[k], labor_lo[k], labor_hi[k],
+                    parts_mean_l[k], parts_std_l[k], parts_ci_low[k], parts_ci_high[k],
+                    total_mean[k], total_std[k], total_lo[k], total_hi[k],
+                )
+            dealer_est, indy_est = estimates["dealer"], estimates["indy"]
+            results[i] = EstimateResult(
+                make=make,
+                model=model,
+                year=year,
+                service=service,
+                vehicle_tier=tiers[k],
+                labor_hours=hours[k],
+                dealer=dealer_est,
+                indy=indy_est,
+                indy_savings_ci_low=max(0, dealer_est.total_ci_low - indy_est.total_ci_high),
+                indy_savings_ci_high=max(0, dealer_est.total_ci_high - indy_est.total_ci_low),
+            )
+        return results
@@ -0,0 +1,61 @@
+"""Shared HTML parsing helpers for the scraping ingesters."""
+
+import threading
+from typing import Iterator
+
+import lxml.html
+from lxml import etree
+
+# XPath expression for the lowercased class attribute; case-folding happens in libxml2.
+_CLASS_LOWER = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+_TABLES = etree.XPath("//table")
+_ROWS = etree.XPath(".//tr")
+_CELLS = etree.XPath(".//td | .//th")
+
+# Parsers are stateful, and pages are parsed from fetch threads, so each thread gets its own
+_parsers = threading.local()
+
+
+def parse_html(html: str) -> etree._Element:
+    """Parse a page without materializing nodes no query looks at.
+
+    Comments, processing instructions and ignorable whitespace are dropped by libxml2
+    while parsing, so the tree (and every XPath walk over it) is smaller.
+    """
+    parser = getattr(_parsers, "parser", None)
+    if parser is None:
+        parser = _parsers.parser = lxml.html.HTMLParser(
+            remove_comments=True, remove_pis=True, remove_blank_text=True
+        )
+    return lxml.html.fromstring(html, parser=parser)
+
+
+def class_contains(*needles: str) -> str:
+    """XPath predicate: the class attribute contains any of the needles, ignoring case.
+
+    Elements without a class are rejected by the [@class] step before any translate().
+    """
+    return "[@class][" + " or ".join(f"contains({_CLASS_LOWER}, '{n}')" for n in needles) + "]"
+
+
+def stripped_text(el: etree._Element) -> str:
+    """Concatenate the element's text nodes, each stripped (bs4's get_text(strip=True))."""
+    if not len(el):
+        # Leaf elements (most table cells) have at most one text node
+        text = el.text
+        return text.strip() if text else ""
+    return "".join(t.strip() for t in el.itertext())
+
+
+def table_pairs(tree: etree._Element) -> Iterator[tuple[str, str]]:
+    """Stripped text of the first two cells of every table row after each table's first.
+
+    Rows with fewer than two cells are skipped. This is the service/value layout both
+    dealer price lists and OEM schedules use.
+    """
+    for table in _TABLES(tree):
+        for row in _ROWS(table)[1:]:
+            cells = _CELLS(row)
+            if len(cells) >= 2:
+                yield stripped_text(cells[0]), stripped_text(cells[1])
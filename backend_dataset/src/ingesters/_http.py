@@ -0,0 +1,79 @@
+"""Shared HTTP helpers for the ingesters."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.settings import HTTP_CACHE_PATH, HTTP_CACHE_TTL
+
+try:
+    from requests_cache import CachedSession
+except ImportError:  # optional: without it every run re-fetches every page
+    CachedSession = None
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Upper bound on in-flight page fetches per ingester run.
+MAX_CONCURRENT_FETCHES = 20
+
+# One connection pool for every ingester session: keep-alive sockets are reused across
+# sessions and threads, and transient failures are retried inside urllib3.
+_ADAPTER = HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504)),
+)
+
+
+def make_session(headers: dict[str, str]) -> requests.Session:
+    """HTTP session for an ingester; GET responses are cached on disk when requests-cache is installed."""
+    if CachedSession is not None:
+        session = CachedSession(
+            str(HTTP_CACHE_PATH),
+            backend="sqlite",
+            expire_after=HTTP_CACHE_TTL,
+            allowable_methods=("GET",),
+        )
+    else:
+        session = requests.Session()
+    session.mount("https://", _ADAPTER)
+    session.mount("http://", _ADAPTER)
+    session.headers.update(headers)
+    return session
+
+
+class ThreadLocalSession:
+    """Hands each thread its own make_session(headers).
+
+    requests.Session is not guaranteed to be thread-safe, and the ingesters fetch from
+    map_concurrent pools; sessions still share _ADAPTER's connection pool.
+    """
+
+    def __init__(self, headers: dict[str, str]):
+        self.headers = headers
+        self._local = threading.local()
+
+    def get(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = make_session(self.headers)
+        return session
+
+
+def map_concurrent(
+    fn: Callable[[T], R],
+    jobs: Iterable[T],
+    max_workers: int = MAX_CONCURRENT_FETCHES,
+) -> list[R]:
+    """Apply fn to each job on a thread pool; results keep the order of jobs."""
+    jobs = list(jobs)
+    if len(jobs) <= 1:
+        return [fn(job) for job in jobs]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+        return list(pool.map(fn, jobs))
+
@@ -0,0 +1,25 @@
+"""Number parsers shared by the scraping ingesters.
+
+Kept free of lxml/pydantic imports and fully annotated so the module can be
+compiled ahead of time (e.g. with mypyc) without touching its callers.
+"""
+
+import re
+
+# Commas are matched inside the number and stripped from the match only.
+_PRICE_RE = re.compile(r"\$?(\d[\d,]*\.?[\d,]*)")
+_MILEAGE_RE = re.compile(r"\d[\d,]*")
+
+
+def parse_price(text: str) -> float | None:
+    """Extract a dollar amount from text like '$1,249.99' or '12.99'."""
+    m = _PRICE_RE.search(text)
+    return float(m.group(1).replace(",", "")) if m else None
+
+
+def parse_mileage(text: str | None) -> int | None:
+    """Extract mileage number from string (e.g. '5,000 mi' -> 5000)."""
+    if not text:
+        return None
+    m = _MILEAGE_RE.search(text)
+    return int(m.group().replace(",", "")) if m else None
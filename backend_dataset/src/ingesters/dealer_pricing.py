@@ -8,19 +8,21 @@ Sources:
 - Public booking platforms (Openbay, RepairPal, etc.)
 """
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from datetime import datetime
+from functools import partial
 
 import requests
-from bs4 import BeautifulSoup
 from loguru import logger
-from tenacity import retry, stop_after_attempt, wait_exponential
+from lxml import etree
 
-from ..models import DealerPrice
+from ._html import class_contains, parse_html, stripped_text, table_pairs
+from ._http import ThreadLocalSession, map_concurrent
+from ._parse import parse_price
+from ..models import DealerPrice, validate_sample
 from config.settings import load_sources_config
 
+_PRICE_OR_SERVICE = etree.XPath(f"//*[self::li or self::div]{class_contains('price', 'service')}")
+
 
 class DealerPricingIngester:
     """Ingest dealer repair pricing from configured sources."""
@@ -28,59 +30,56 @@ class DealerPricingIngester:
     def __init__(self, dealer_urls: list[str] | None = None):
         self.config = load_sources_config()["dealer_repair_pricing"]
         self.dealer_urls = dealer_urls or []
-        self.session = requests.Session()
-        self.session.headers.update({
+        self._sessions = ThreadLocalSession({
             "User-Agent": "Mozilla/5.0 (compatible; MaintenancePipeline/1.0; +research)"
         })
         self.results: list[DealerPrice] = []
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    @property
+    def session(self) -> requests.Session:
+        """One session per thread: run() fetches dealer pages from a thread pool."""
+        return self._sessions.get()
+
     def _fetch_url(self, url: str) -> str:
         """Fetch URL with retries."""
         resp = self.session.get(url, timeout=30)
         resp.raise_for_status()
         return resp.text
 
-    def _parse_dealer_page(self, url: str, dealer_name: str) -> list[DealerPrice]:
-        """Parse dealer service/price page."""
+    def _parse_dealer_page(self, url: str, dealer_name: str, scraped_at: datetime | None = None) -> list[DealerPrice]:
+        """Parse dealer service/price page; rows share scraped_at (default: now)."""
         items = []
         try:
             html = self._fetch_url(url)
-            soup = BeautifulSoup(html, "lxml")
+            tree = parse_html(html)
+
+            # Bind the per-row callables once; only service and price vary between rows.
+            # Rows are built from parsed strings and floats, so skip per-row validation.
+            add = items.append
+            dealer_price = partial(
+                DealerPrice.model_construct,
+                dealer_name=dealer_name,
+                source="dealer_service_page",
+                source_url=url,
+                scraped_at=scraped_at or datetime.utcnow(),
+            )
 
             # Common patterns: service menus, price lists, tables
-            for table in soup.find_all("table"):
-                for row in table.find_all("tr")[1:]:
-                    cells = row.find_all(["td", "th"])
-                    if len(cells) >= 2:
-                        service = cells[0].get_text(strip=True)
-                        price_str = cells[1].get_text(strip=True) if len(cells) > 1 else "0"
-                        price = self._parse_price(price_str)
-                        if price and service:
-                            items.append(DealerPrice(
-                                dealer_name=dealer_name,
-                                service_name=service,
-                                labor_cost=price,
-                                total_cost=price,
-                                source="dealer_service_page",
-                                source_url=url,
-                            ))
+            for service, price_text in table_pairs(tree):
+                price = parse_price(price_text)
+                if price and service:
+                    add(dealer_price(service_name=service, labor_cost=price, total_cost=price))
 
             # Also check lists/divs with common price patterns
-            for elem in soup.find_all(["li", "div"], class_=lambda c: c and ("price" in str(c).lower() or "service" in str(c).lower())):
-                text = elem.get_text(strip=True)
-                price = self._parse_price(text)
+            for elem in _PRICE_OR_SERVICE(tree):
+                text = stripped_text(elem)
+                price = parse_price(text)
                 if price:
                     service = text.replace(f"${price}", "").strip()
                     if len(service) > 3:
-                        items.append(DealerPrice(
-                            dealer_name=dealer_name,
-                            service_name=service[:200],
-                            labor_cost=price,
-                            total_cost=price,
-                            source="dealer_service_page",
-                            source_url=url,
-                        ))
+                        add(dealer_price(service_name=service[:200], labor_cost=price, total_cost=price))
+
+            validate_sample(items)
 
             logger.info(f"Extracted {len(items)} dealer prices from {url}")
         except Exception as e:
@@ -90,9 +89,7 @@ class DealerPricingIngester:
 
     def _parse_price(self, s: str) -> float | None:
         """Extract dollar amount from string."""
-        import re
-        m = re.search(r"\$?([\d,]+\.?\d*)", s.replace(",", ""))
-        return float(m.group(1)) if m else None
+        return parse_price(s)
 
     def run(self, dealer_urls: list[tuple[str, str]] | None = None) -> list[DealerPrice]:
         """
@@ -100,11 +97,13 @@ class DealerPricingIngester:
         dealer_urls: list of (url, dealer_name) tuples.
         """
         logger.info("Starting dealer pricing ingestion")
+        scraped_at = datetime.utcnow()  # one timestamp for the whole run
 
         urls = dealer_urls or [(u, "Dealer") for u in self.dealer_urls]
 
-        for url, dealer_name in urls:
-            self.results.extend(self._parse_dealer_page(url, dealer_name))
+        # Pages are independent, so fetch them concurrently; order is preserved.
+        for items in map_concurrent(lambda job: self._parse_dealer_page(*job, scraped_at), urls):
+            self.results.extend(items)
 
         logger.info(f"Dealer pricing: ingested {len(self.results)} items")
         return self.results
@@ -8,16 +8,64 @@ Sources:
 - Fleet maintenance docs
 """
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from functools import partial
+from itertools import repeat
 
+import pandas as pd
 from loguru import logger
 
-from ..models import LaborStandard
+from ..models import LaborStandard, validate_sample
 from config.settings import load_sources_config, RAW_DIR
 
+# Column aliases accepted in fleet CSVs, in order of preference
+_OPERATION_COLUMNS = ("operation", "service", "task")
+_HOURS_COLUMNS = ("hours", "labor_hours", "time")
+_FLEET_COLUMNS = frozenset(_OPERATION_COLUMNS + _HOURS_COLUMNS + ("vehicle_scope",))
+
+# Common labor times (Mitchell/Chilton-style) - can be expanded from public references
+_DEFAULT_OPERATIONS = (
+    ("Oil Change", 0.5),
+    ("Transmission Fluid Change", 0.75),
+    ("Brake Fluid Change", 0.5),
+    ("Air Filter", 0.25),
+    ("Cabin Air Filter", 0.25),
+    ("TPMS Sensor", 0.5),
+    ("Brake Pad Replacement (Front)", 1.5),
+    ("Brake Pad Replacement (Rear)", 1.0),
+    ("Brake Rotor Replacement (Front)", 1.0),
+    ("Brake Rotor Replacement (Rear)", 1.0),
+    ("Alternator Replacement", 1.5),
+    ("Starter Replacement", 1.0),
+    ("Battery Replacement", 0.25),
+    ("Spark Plug Replacement (4-cyl)", 1.0),
+    ("Spark Plug Replacement (6-cyl)", 1.5),
+    ("Spark Plug Replacement (8-cyl)", 2.0),
+    ("Timing Belt Replacement", 4.0),
+    ("Water Pump Replacement", 2.5),
+    ("Thermostat Replacement", 1.0),
+    ("Radiator Replacement", 3.0),
+    ("AC Recharge", 0.5),
+    ("Compressor Replacement", 3.0),
+    ("Tire Rotation", 0.25),
+    ("Wheel Alignment", 1.0),
+    ("Strut Replacement (Front)", 2.0),
+    ("Strut Replacement (Rear)", 1.5),
+)
+
+# Built once at import; every run shares these instances, so treat them as read-only
+_MANUAL_STANDARDS = tuple(
+    LaborStandard.model_construct(operation=op, labor_hours=h, source="curated_manual", confidence=0.9)
+    for op, h in _DEFAULT_OPERATIONS
+)
+
+
+def _coalesce(df: pd.DataFrame, columns: tuple[str, ...]) -> pd.Series:
+    """First non-empty value per row across columns (NaN when there is none)."""
+    present = [c for c in columns if c in df.columns]
+    if not present:
+        return pd.Series(index=df.index, dtype=str)
+    return df[present].replace("", None).bfill(axis=1).iloc[:, 0]
+
 
 class LaborStandardsIngester:
     """Ingest labor time standards from configured sources."""
@@ -34,26 +82,22 @@ class LaborStandardsIngester:
             logger.info(f"No fleet docs at {fleet_dir}")
             return items
 
-        import csv
         for path in fleet_dir.glob("*.csv"):
             try:
-                with open(path) as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        op = row.get("operation") or row.get("service") or row.get("task", "")
-                        hours = row.get("hours") or row.get("labor_hours") or row.get("time", "0")
-                        try:
-                            h = float(str(hours).replace(",", "."))
-                            if op and h > 0:
-                                items.append(LaborStandard(
-                                    operation=op,
-                                    labor_hours=h,
-                                    source="fleet_maintenance_docs",
-                                    source_url=str(path),
-                                    vehicle_scope=row.get("vehicle_scope"),
-                                ))
-                        except ValueError:
-                            pass
+                # Only empty cells count as missing; "NA"/"null" are kept as text
+                df = pd.read_csv(path, usecols=lambda c: c in _FLEET_COLUMNS, dtype=str, keep_default_na=False)
+                ops = _coalesce(df, _OPERATION_COLUMNS)
+                hours = pd.to_numeric(_coalesce(df, _HOURS_COLUMNS).str.replace(",", ".", regex=False), errors="coerce")
+                keep = ops.notna() & (hours > 0)
+                scopes = df["vehicle_scope"][keep] if "vehicle_scope" in df.columns else repeat(None)
+                # Rows are already str/float here, so skip per-row validation
+                labor_standard = partial(LaborStandard.model_construct, source="fleet_maintenance_docs", source_url=str(path))
+                batch = [
+                    labor_standard(operation=op, labor_hours=h, vehicle_scope=scope or None)
+                    for op, h, scope in zip(ops[keep], hours[keep].tolist(), scopes)
+                ]
+                validate_sample(batch)
+                items.extend(batch)
             except Exception as e:
                 logger.warning(f"Failed to parse {path}: {e}")
 
@@ -61,39 +105,7 @@ class LaborStandardsIngester:
 
     def _load_manual_standards(self) -> list[LaborStandard]:
         """Load curated labor standards (Mitchell/Chilton-style reference)."""
-        # Common labor times - can be expanded from public references
-        defaults = [
-            ("Oil Change", 0.5),
-            ("Transmission Fluid Change", 0.75),
-            ("Brake Fluid Change", 0.5),
-            ("Air Filter", 0.25),
-            ("Cabin Air Filter", 0.25),
-            ("TPMS Sensor", 0.5),
-            ("Brake Pad Replacement (Front)", 1.5),
-            ("Brake Pad Replacement (Rear)", 1.0),
-            ("Brake Rotor Replacement (Front)", 1.0),
-            ("Brake Rotor Replacement (Rear)", 1.0),
-            ("Alternator Replacement", 1.5),
-            ("Starter Replacement", 1.0),
-            ("Battery Replacement", 0.25),
-            ("Spark Plug Replacement (4-cyl)", 1.0),
-            ("Spark Plug Replacement (6-cyl)", 1.5),
-            ("Spark Plug Replacement (8-cyl)", 2.0),
-            ("Timing Belt Replacement", 4.0),
-            ("Water Pump Replacement", 2.5),
-            ("Thermostat Replacement", 1.0),
-            ("Radiator Replacement", 3.0),
-            ("AC Recharge", 0.5),
-            ("Compressor Replacement", 3.0),
-            ("Tire Rotation", 0.25),
-            ("Wheel Alignment", 1.0),
-            ("Strut Replacement (Front)", 2.0),
-            ("Strut Replacement (Rear)", 1.5),
-        ]
-        return [
-            LaborStandard(operation=op, labor_hours=h, source="curated_manual", confidence=0.9)
-            for op, h in defaults
-        ]
+        return list(_MANUAL_STANDARDS)
 
     def run(self) -> list[LaborStandard]:
         """Run labor standards ingestion."""
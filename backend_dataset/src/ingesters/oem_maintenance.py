@@ -8,64 +8,105 @@ Sources:
 - Public service bulletins
 """
 
-import sys
+import importlib.util
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 import requests
-from bs4 import BeautifulSoup
 from loguru import logger
-from tenacity import retry, stop_after_attempt, wait_exponential
 
-from ..models import MaintenanceItem
+from ._html import parse_html, table_pairs
+from ._http import ThreadLocalSession, map_concurrent
+from ._parse import parse_mileage
+from ..models import MaintenanceItem, validate_sample
 from config.settings import load_sources_config, RAW_DIR
 
 
+def _extract_pdf(pdf_path: Path, ingested_at: datetime | None = None) -> list[MaintenanceItem]:
+    """Extract schedule rows from one owner-manual PDF (module-level so worker processes can run it)."""
+    import pdfplumber
+
+    items = []
+    ingested_at = ingested_at or datetime.utcnow()
+    make = pdf_path.stem.split("_")[0] if "_" in pdf_path.stem else "Unknown"
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            for page in pdf.pages:
+                tables = page.extract_tables()
+                for table in tables:
+                    if table:
+                        for row in table[1:]:
+                            if row and len(row) >= 2:
+                                items.append(MaintenanceItem.model_construct(
+                                    make=make,
+                                    model="*",
+                                    year=0,
+                                    service_type="scheduled",
+                                    service_name=str(row[0])[:200],
+                                    mileage_interval=parse_mileage(str(row[1]) if row[1] else None),
+                                    source="owner_manual_pdf",
+                                    source_url=str(pdf_path),
+                                    confidence=0.8,
+                                    ingested_at=ingested_at,
+                                ))
+        validate_sample(items)
+    except Exception as e:
+        logger.warning(f"Failed to parse PDF {pdf_path}: {e}")
+    return items
+
+
 class OEMMaintenanceIngester:
     """Ingest OEM maintenance schedules from configured sources."""
 
     def __init__(self):
         self.config = load_sources_config()["oem_maintenance_schedules"]
-        self.session = requests.Session()
-        self.session.headers.update({
+        self._sessions = ThreadLocalSession({
             "User-Agent": "Mozilla/5.0 (compatible; MaintenancePipeline/1.0; +research)"
         })
         self.results: list[MaintenanceItem] = []
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    @property
+    def session(self) -> requests.Session:
+        """One session per thread: run() fetches OEM pages from a thread pool."""
+        return self._sessions.get()
+
     def _fetch_url(self, url: str) -> str:
         """Fetch URL with retries."""
         resp = self.session.get(url, timeout=30)
         resp.raise_for_status()
         return resp.text
 
-    def _parse_maintenance_website(self, url: str, make: str) -> list[MaintenanceItem]:
-        """Parse manufacturer maintenance webpage (structure varies by OEM)."""
+    def _parse_maintenance_website(
+        self, url: str, make: str, ingested_at: datetime | None = None
+    ) -> list[MaintenanceItem]:
+        """Parse manufacturer maintenance webpage (structure varies by OEM); rows share ingested_at."""
         items = []
         try:
             html = self._fetch_url(url)
-            soup = BeautifulSoup(html, "lxml")
+            tree = parse_html(html)
+
+            add = items.append
+            maintenance_item = partial(
+                MaintenanceItem.model_construct,  # rows are normalized here; validate_sample checks one
+                make=make,
+                model="*",  # May need model-specific pages
+                year=0,  # Placeholder
+                service_type="scheduled",
+                source="manufacturer_website",
+                source_url=url,
+                confidence=0.7,
+                ingested_at=ingested_at or datetime.utcnow(),
+            )
 
             # Generic extraction - OEM sites have different structures
             # Common patterns: tables, lists, accordions
-            for table in soup.find_all("table"):
-                for row in table.find_all("tr")[1:]:
-                    cells = row.find_all(["td", "th"])
-                    if len(cells) >= 2:
-                        service_name = cells[0].get_text(strip=True)
-                        interval = cells[1].get_text(strip=True) if len(cells) > 1 else None
-                        items.append(MaintenanceItem(
-                            make=make,
-                            model="*",  # May need model-specific pages
-                            year=0,  # Placeholder
-                            service_type="scheduled",
-                            service_name=service_name,
-                            mileage_interval=self._parse_mileage(interval),
-                            source="manufacturer_website",
-                            source_url=url,
-                            confidence=0.7,
-                        ))
+            for service_name, interval in table_pairs(tree):
+                add(maintenance_item(service_name=service_name, mileage_interval=parse_mileage(interval)))
+            validate_sample(items)
 
             logger.info(f"Extracted {len(items)} items from {url}")
         except Exception as e:
@@ -75,13 +116,9 @@ class OEMMaintenanceIngester:
 
     def _parse_mileage(self, s: str | None) -> int | None:
         """Extract mileage number from string (e.g. '5,000 mi' -> 5000)."""
-        if not s:
-            return None
-        import re
-        m = re.search(r"[\d,]+", s.replace(",", ""))
-        return int(m.group()) if m else None
+        return parse_mileage(s)
 
-    def _load_pdf_manuals(self) -> list[MaintenanceItem]:
+    def _load_pdf_manuals(self, ingested_at: datetime | None = None) -> list[MaintenanceItem]:
         """Load maintenance data from PDF manuals in storage."""
         items = []
         manuals_dir = RAW_DIR / "oem_manuals"
@@ -89,38 +126,27 @@ class OEMMaintenanceIngester:
             logger.info(f"No PDF manuals at {manuals_dir}")
             return items
 
-        try:
-            import pdfplumber
-            for pdf_path in manuals_dir.glob("*.pdf"):
-                try:
-                    with pdfplumber.open(pdf_path) as pdf:
-                        for page in pdf.pages:
-                            tables = page.extract_tables()
-                            for table in tables:
-                                if table:
-                                    for row in table[1:]:
-                                        if row and len(row) >= 2:
-                                            items.append(MaintenanceItem(
-                                                make=pdf_path.stem.split("_")[0] if "_" in pdf_path.stem else "Unknown",
-                                                model="*",
-                                                year=0,
-                                                service_type="scheduled",
-                                                service_name=str(row[0])[:200],
-                                                mileage_interval=self._parse_mileage(str(row[1]) if row[1] else None),
-                                                source="owner_manual_pdf",
-                                                source_url=str(pdf_path),
-                                                confidence=0.8,
-                                            ))
-                except Exception as e:
-                    logger.warning(f"Failed to parse PDF {pdf_path}: {e}")
-        except ImportError:
+        if importlib.util.find_spec("pdfplumber") is None:
             logger.warning("pdfplumber not installed; skipping PDF parsing")
+            return items
 
+        # pdfplumber's layout analysis is CPU-bound Python, so spread files across processes
+        pdf_paths = sorted(manuals_dir.glob("*.pdf"))
+        extract = partial(_extract_pdf, ingested_at=ingested_at or datetime.utcnow())
+        if len(pdf_paths) <= 1:
+            return [item for path in pdf_paths for item in extract(path)]
+        # Spawn, not fork: run_pipeline calls this from a pool thread while other ingesters'
+        # threads may hold locks (logging, HTTP cache) that a forked child would inherit held
+        workers = min(len(pdf_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            for pdf_items in pool.map(extract, pdf_paths):
+                items.extend(pdf_items)
         return items
 
     def run(self) -> list[MaintenanceItem]:
         """Run full OEM maintenance ingestion."""
         logger.info("Starting OEM maintenance ingestion")
+        ingested_at = datetime.utcnow()  # one timestamp for the whole run
 
         for source in self.config["sources"]:
             if not source.get("enabled", True):
@@ -128,12 +154,15 @@ class OEMMaintenanceIngester:
 
             if source["type"] == "website" and "base_urls" in source:
                 make_map = {"toyota": "Toyota", "honda": "Honda", "ford": "Ford"}
-                for url in source["base_urls"]:
-                    make = next((m for k, m in make_map.items() if k in url.lower()), "Unknown")
-                    self.results.extend(self._parse_maintenance_website(url, make))
+                jobs = [
+                    (url, next((m for k, m in make_map.items() if k in url.lower()), "Unknown"))
+                    for url in source["base_urls"]
+                ]
+                for items in map_concurrent(lambda job: self._parse_maintenance_website(*job, ingested_at), jobs):
+                    self.results.extend(items)
 
             elif source["type"] == "pdf":
-                self.results.extend(self._load_pdf_manuals())
+                self.results.extend(self._load_pdf_manuals(ingested_at))
 
         logger.info(f"OEM maintenance: ingested {len(self.results)} items")
         return self.results
@@ -10,32 +10,128 @@ Sources:
 - OEM parts catalogs
 """
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from datetime import datetime
 
 import requests
-from bs4 import BeautifulSoup
 from loguru import logger
-from tenacity import retry, stop_after_attempt, wait_exponential
+from lxml import etree
 
-from ..models import PartsPrice
+from ._html import class_contains, parse_html, stripped_text
+from ._http import ThreadLocalSession, map_concurrent
+from ._parse import parse_price
+from ..models import PartsPrice, validate_sample
 from config.settings import load_sources_config
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional: falls back to lxml below
+    LexborHTMLParser = None
+
+# Concurrent (retailer, query) page fetches per run
+PARTS_MAX_CONCURRENT = 10
+
+# Class-name fragments that mark product cards, prices and product names
+_PRODUCT_NEEDLES = ("product",)
+_PRICE_NEEDLES = ("price",)
+_NAME_NEEDLES = ("name", "title")
+
+_PRODUCTS = etree.XPath(f"//*[self::div or self::li or self::tr]{class_contains(*_PRODUCT_NEEDLES)}")
+_DOLLAR_TEXT = etree.XPath(".//text()[contains(., '$')]")
+_PRICE_CLASS = etree.XPath(f".//*{class_contains(*_PRICE_NEEDLES)}")
+_NAME_CLASS = etree.XPath(f".//*[self::h2 or self::h3 or self::a or self::span]{class_contains(*_NAME_NEEDLES)}")
+_PRODUCT_LINKS = etree.XPath("//a[contains(@href, '/product') or contains(@href, '/part')]")
+
+# The same queries as CSS for Lexbor; the "i" flag folds case like class_contains does
+_PRODUCTS_CSS = ", ".join(f"{tag}[class*='{n}' i]" for tag in ("div", "li", "tr") for n in _PRODUCT_NEEDLES)
+_PRICE_CLASS_CSS = ", ".join(f"[class*='{n}' i]" for n in _PRICE_NEEDLES)
+_NAME_CLASS_CSS = ", ".join(f"{tag}[class*='{n}' i]" for tag in ("h2", "h3", "a", "span") for n in _NAME_NEEDLES)
+_PRODUCT_LINKS_CSS = "a[href*='/product'], a[href*='/part']"
+
+
+def _products_lxml(html: str) -> list[tuple[str, float]]:
+    """(name, price) pairs from a listing page, parsed with lxml."""
+    tree = parse_html(html)
+    products = []
+
+    # Common patterns: product cards, tables, list items
+    for elem in _PRODUCTS(tree):
+        dollar_text = _DOLLAR_TEXT(elem)
+        if dollar_text:
+            price = parse_price(str(dollar_text[0]))
+        else:
+            price_elem = _PRICE_CLASS(elem)
+            price = parse_price("".join(price_elem[0].itertext())) if price_elem else None
+
+        name_elem = _NAME_CLASS(elem)
+        name = stripped_text(name_elem[0])[:200] if name_elem else stripped_text(elem)[:200]
+
+        if price and name and len(name) > 2:
+            products.append((name, price))
+
+    # Fallback: look for any price + text combos
+    if not products:
+        for link in _PRODUCT_LINKS(tree):
+            parent = link.getparent()
+            if parent is not None:
+                price = parse_price(stripped_text(parent))
+                name = stripped_text(link)
+                if price and name:
+                    products.append((name[:200], price))
+
+    return products
+
+
+def _products_lexbor(html: str) -> list[tuple[str, float]]:
+    """Same extraction as _products_lxml on selectolax's Lexbor parser (C HTML5 DOM and CSS matching)."""
+    tree = LexborHTMLParser(html)
+    products = []
+
+    for node in tree.css(_PRODUCTS_CSS):
+        # First text node containing "$", as _DOLLAR_TEXT picks it
+        dollar_text = next((t for t in node.text(separator="\0").split("\0") if "$" in t), None)
+        if dollar_text is not None:
+            price = parse_price(dollar_text)
+        else:
+            price_node = node.css_first(_PRICE_CLASS_CSS)
+            price = parse_price(price_node.text()) if price_node is not None else None
+
+        name_node = node.css_first(_NAME_CLASS_CSS)
+        name = (name_node if name_node is not None else node).text(strip=True)[:200]
+
+        if price and name and len(name) > 2:
+            products.append((name, price))
+
+    if not products:
+        for link in tree.css(_PRODUCT_LINKS_CSS):
+            parent = link.parent
+            if parent is not None:
+                price = parse_price(parent.text(strip=True))
+                name = link.text(strip=True)
+                if price and name:
+                    products.append((name[:200], price))
+
+    return products
+
+
+_extract_products = _products_lexbor if LexborHTMLParser is not None else _products_lxml
+
 
 class PartsPricingIngester:
     """Ingest parts pricing from retailer websites."""
 
     def __init__(self):
         self.config = load_sources_config()["parts_pricing"]
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; rv:91.0) Gecko/20100101 Firefox/91.0"
-        })
+        }
+        self._sessions = ThreadLocalSession(self.headers)
         self.results: list[PartsPrice] = []
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    @property
+    def session(self) -> requests.Session:
+        """One session per thread: run() scrapes retailers from a thread pool."""
+        return self._sessions.get()
+
     def _fetch_url(self, url: str) -> str:
         """Fetch URL with retries."""
         resp = self.session.get(url, timeout=30)
@@ -44,52 +140,22 @@ class PartsPricingIngester:
 
     def _parse_price_element(self, text: str) -> float | None:
         """Extract price from text like $12.99 or 12.99."""
-        import re
-        m = re.search(r"\$?([\d,]+\.?\d*)", text.replace(",", ""))
-        return float(m.group(1)) if m else None
+        return parse_price(text)
 
-    def _scrape_parts_page(self, url: str, retailer: str) -> list[PartsPrice]:
-        """Generic scrape for parts listing pages."""
+    def _scrape_parts_page(self, url: str, retailer: str, scraped_at: datetime | None = None) -> list[PartsPrice]:
+        """Generic scrape for parts listing pages; rows share scraped_at (default: now)."""
         items = []
         try:
             html = self._fetch_url(url)
-            soup = BeautifulSoup(html, "lxml")
-
-            # Common patterns: product cards, tables, list items
-            for elem in soup.find_all(["div", "li", "tr"], class_=lambda c: c and "product" in str(c).lower() if c else False):
-                price_elem = elem.find(string=lambda t: t and "$" in str(t))
-                if not price_elem:
-                    price_elem = elem.find(class_=lambda c: c and "price" in str(c).lower() if c else False)
-                price = self._parse_price_element(price_elem.get_text() if price_elem else "") if price_elem else None
-
-                name_elem = elem.find(["h2", "h3", "a", "span"], class_=lambda c: c and ("name" in str(c).lower() or "title" in str(c).lower()) if c else False)
-                name = name_elem.get_text(strip=True)[:200] if name_elem else elem.get_text(strip=True)[:200]
-
-                if price and name and len(name) > 2:
-                    items.append(PartsPrice(
-                        part_name=name,
-                        price=price,
-                        retailer=retailer,
-                        source_url=url,
-                    ))
-
-            # Fallback: look for any price + text combos
-            if not items:
-                for link in soup.find_all("a", href=True):
-                    if "/product" in link.get("href", "") or "/part" in link.get("href", ""):
-                        parent = link.parent
-                        if parent:
-                            text = parent.get_text(strip=True)
-                            price = self._parse_price_element(text)
-                            name = link.get_text(strip=True)
-                            if price and name:
-                                items.append(PartsPrice(
-                                    part_name=name[:200],
-                                    price=price,
-                                    retailer=retailer,
-                                    source_url=url,
-                                ))
-
+            scraped_at = scraped_at or datetime.utcnow()
+            # (name, price) pairs are already str/float, so skip per-row validation
+            items = [
+                PartsPrice.model_construct(
+                    part_name=name, price=price, retailer=retailer, source_url=url, scraped_at=scraped_at
+                )
+                for name, price in _extract_products(html)
+            ]
+            validate_sample(items)
             logger.info(f"Extracted {len(items)} parts from {retailer} @ {url}")
         except Exception as e:
             logger.warning(f"Failed to scrape {retailer} {url}: {e}")
@@ -102,6 +168,7 @@ class PartsPricingIngester:
         search_queries: optional list of part names to search (drives URLs).
         """
         logger.info("Starting parts pricing ingestion")
+        scraped_at = datetime.utcnow()  # one timestamp for the whole run
 
         queries = search_queries or ["oil+filter", "brake+pads", "spark+plugs"]
         retailer_urls = {
@@ -112,6 +179,7 @@ class PartsPricingIngester:
             "Amazon": "https://www.amazon.com/s?k=",
         }
 
+        jobs = []
         for source in self.config["sources"]:
             if not source.get("enabled", True):
                 continue
@@ -121,7 +189,10 @@ class PartsPricingIngester:
                 continue
             for q in queries[:2]:  # Limit per retailer to avoid hammering
                 url = f"{base}{q}" if "=" in base or base.endswith("/") else f"{base}?q={q}"
-                self.results.extend(self._scrape_parts_page(url, retailer))
+                jobs.append((url, retailer))
+
+        for items in map_concurrent(lambda job: self._scrape_parts_page(*job, scraped_at), jobs, PARTS_MAX_CONCURRENT):
+            self.results.extend(items)
 
         logger.info(f"Parts pricing: ingested {len(self.results)} items")
         return self.results
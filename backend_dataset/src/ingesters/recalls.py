@@ -7,57 +7,108 @@ Sources:
 - Technical Service Bulletins (TSBs)
 """
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import json
+from itertools import islice
+from typing import Iterator
 
 import requests
 from loguru import logger
-from tenacity import retry, stop_after_attempt, wait_exponential
 
+from ._http import ThreadLocalSession, map_concurrent
 from ..models import Recall, TSB
 from config.settings import load_sources_config, NHTSA_BASE_URL
 
+try:
+    import ijson
+except ImportError:  # optional: without it responses are decoded whole
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is the fallback decoder
+    orjson = None
+
+# Concurrent NHTSA lookups per run; kept low to respect the API's fair-use limits.
+NHTSA_MAX_CONCURRENT = 10
+
+# Responses at least this large (or of unknown length) are streamed with ijson;
+# smaller ones are decoded in one orjson call, which is faster when memory isn't a concern.
+NHTSA_STREAM_MIN_BYTES = 1 << 20
+
+
+def _loads(body: bytes):
+    """Decode a JSON body with orjson when installed."""
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+def _make_recall(r: dict) -> Recall:
+    """Build a Recall from one NHTSA API result row."""
+    campaign = r.get("NHTSACampaignNumber")
+    year = r.get("ModelYear")
+    return Recall(
+        nhtsa_id=campaign,
+        campaign_number=campaign,
+        component=r.get("Component", ""),
+        summary=r.get("Summary", ""),
+        # NHTSA spells this "Conequence" on most endpoints
+        consequence=r.get("Consequence", r.get("Conequence")),
+        remedy=r.get("Remedy"),
+        manufacturer=r.get("Manufacturer", ""),
+        make=r.get("Make", ""),
+        model=r.get("Model", ""),
+        year=int(year) if year else None,
+        source="NHTSA",
+    )
+
 
 class RecallsIngester:
     """Ingest recalls and TSBs - NHTSA API is fully implemented."""
 
     def __init__(self):
         self.config = load_sources_config()["recalls_and_issues"]
-        self.session = requests.Session()
-        self.session.headers.update({"Accept": "application/json"})
+        self._sessions = ThreadLocalSession({"Accept": "application/json"})
         self.base_url = NHTSA_BASE_URL
         self.recalls: list[Recall] = []
         self.tsbs: list[TSB] = []
+        # Successful by-vehicle lookups, so repeated (make, model, year) keys cost no request
+        self._vehicle_cache: dict[tuple[str, str, int], tuple[Recall, ...]] = {}
+
+    @property
+    def session(self) -> requests.Session:
+        """One session per thread: run() looks up VINs and vehicles from a thread pool."""
+        return self._sessions.get()
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     def _fetch_nhtsa(self, path: str, params: dict | None = None) -> dict:
         """Fetch NHTSA API endpoint."""
         url = f"{self.base_url}{path}"
         resp = self.session.get(url, params=params or {}, timeout=30)
         resp.raise_for_status()
-        return resp.json()
+        return _loads(resp.content)
+
+    def _iter_nhtsa_results(self, path: str, params: dict | None = None) -> Iterator[dict]:
+        """Yield the records in an NHTSA response's "results" array.
+
+        With ijson, large bodies are parsed as they arrive, one record at a time, so
+        big component queries never materialize the whole document.
+        """
+        if ijson is None:
+            yield from self._fetch_nhtsa(path, params).get("results", [])
+            return
+        url = f"{self.base_url}{path}"
+        with self.session.get(url, params=params or {}, timeout=30, stream=True) as resp:
+            resp.raise_for_status()
+            size = int(resp.headers.get("Content-Length") or 0)
+            if 0 < size < NHTSA_STREAM_MIN_BYTES:
+                yield from _loads(resp.content).get("results", [])
+                return
+            resp.raw.decode_content = True  # undo gzip/deflate before ijson sees the bytes
+            yield from ijson.items(resp.raw, "results.item", use_float=True)
 
     def get_recalls_by_vin(self, vin: str) -> list[Recall]:
         """Get recalls for a specific VIN. NHTSA API - works out of the box."""
         try:
-            data = self._fetch_nhtsa("/recalls/recallsByVIN", {"vin": vin})
-            items = []
-            for r in data.get("results", []):
-                items.append(Recall(
-                    nhtsa_id=r.get("NHTSACampaignNumber"),
-                    campaign_number=r.get("NHTSACampaignNumber"),
-                    component=r.get("Component", ""),
-                    summary=r.get("Summary", ""),
-                    consequence=r.get("Conequence"),
-                    remedy=r.get("Remedy"),
-                    manufacturer=r.get("Manufacturer", ""),
-                    make=r.get("Make", ""),
-                    model=r.get("Model", ""),
-                    year=int(r["ModelYear"]) if r.get("ModelYear") else None,
-                    source="NHTSA",
-                ))
+            results = self._iter_nhtsa_results("/recalls/recallsByVIN", {"vin": vin})
+            items = [_make_recall(r) for r in results]
             logger.info(f"NHTSA: {len(items)} recalls for VIN {vin[:8]}...")
             return items
         except Exception as e:
@@ -67,50 +118,25 @@ class RecallsIngester:
     def get_recalls_by_campaign(self, campaign_number: str) -> list[Recall]:
         """Get recalls by NHTSA campaign number."""
         try:
-            data = self._fetch_nhtsa("/recalls/recallsByCampaignNumber", {"campaignNumber": campaign_number})
-            items = []
-            for r in data.get("results", []):
-                items.append(Recall(
-                    nhtsa_id=r.get("NHTSACampaignNumber"),
-                    campaign_number=r.get("NHTSACampaignNumber"),
-                    component=r.get("Component", ""),
-                    summary=r.get("Summary", ""),
-                    consequence=r.get("Conequence"),
-                    remedy=r.get("Remedy"),
-                    manufacturer=r.get("Manufacturer", ""),
-                    make=r.get("Make", ""),
-                    model=r.get("Model", ""),
-                    year=int(r["ModelYear"]) if r.get("ModelYear") else None,
-                    source="NHTSA",
-                ))
-            return items
+            results = self._iter_nhtsa_results("/recalls/recallsByCampaignNumber", {"campaignNumber": campaign_number})
+            return [_make_recall(r) for r in results]
         except Exception as e:
             logger.warning(f"NHTSA campaign fetch failed: {e}")
             return []
 
     def get_recalls_by_vehicle(self, make: str, model: str, year: int) -> list[Recall]:
         """Get recalls for make/model/year. Uses NHTSA Recalls by Vehicle endpoint."""
+        key = (make, model, year)
+        cached = self._vehicle_cache.get(key)
+        if cached is not None:
+            return list(cached)
         try:
             # NHTSA: /recalls/recallsByVehicle?make=...&model=...&modelYear=...
             path = "/recalls/recallsByVehicle"
             params = {"make": make, "model": model, "modelYear": year}
-            data = self._fetch_nhtsa(path, params)
-            items = []
-            for r in data.get("results", []):
-                items.append(Recall(
-                    nhtsa_id=r.get("NHTSACampaignNumber"),
-                    campaign_number=r.get("NHTSACampaignNumber"),
-                    component=r.get("Component", ""),
-                    summary=r.get("Summary", ""),
-                    consequence=r.get("Conequence"),
-                    remedy=r.get("Remedy"),
-                    manufacturer=r.get("Manufacturer", ""),
-                    make=r.get("Make", ""),
-                    model=r.get("Model", ""),
-                    year=int(r["ModelYear"]) if r.get("ModelYear") else None,
-                    source="NHTSA",
-                ))
+            items = [_make_recall(r) for r in self._iter_nhtsa_results(path, params)]
             logger.info(f"NHTSA: {len(items)} recalls for {year} {make} {model}")
+            self._vehicle_cache[key] = tuple(items)
             return items
         except Exception as e:
             logger.warning(f"NHTSA vehicle recall fetch failed: {e}")
@@ -121,8 +147,7 @@ class RecallsIngester:
         try:
             path = "/complaints/complaintsByVehicle"
             params = {"make": make, "model": model, "modelYear": year}
-            data = self._fetch_nhtsa(path, params)
-            return data.get("results", [])
+            return list(self._iter_nhtsa_results(path, params))
         except Exception as e:
             logger.warning(f"NHTSA complaints fetch failed: {e}")
             return []
@@ -141,33 +166,22 @@ class RecallsIngester:
             if source.get("name") != "nhtsa":
                 continue
 
-            if vins:
-                for vin in vins[:20]:  # Limit
-                    self.recalls.extend(self.get_recalls_by_vin(vin))
-
-            if vehicles:
-                for make, model, year in vehicles[:50]:
-                    self.recalls.extend(self.get_recalls_by_vehicle(make, model, year))
+            # VIN and vehicle lookups are independent round-trips, so overlap them.
+            # Fleet inputs repeat VINs and vehicles; dedupe (keeping first-seen order) before the limits.
+            unique_vins = list(dict.fromkeys(vins or []))[:20]
+            unique_vehicles = list(dict.fromkeys(tuple(v) for v in vehicles or []))[:50]
+            lookups = [(self.get_recalls_by_vin, (vin,)) for vin in unique_vins]
+            lookups += [(self.get_recalls_by_vehicle, vehicle) for vehicle in unique_vehicles]
+            for items in map_concurrent(lambda job: job[0](*job[1]), lookups, NHTSA_MAX_CONCURRENT):
+                self.recalls.extend(items)
 
             # Fallback: fetch some recent recalls if no input
             if not vins and not vehicles:
                 try:
                     # NHTSA Recalls by Component - can get recent recalls
-                    data = self._fetch_nhtsa("/recalls/recallsByComponent", {"component": "air bags"})
-                    for r in data.get("results", [])[:20]:
-                        self.recalls.append(Recall(
-                            nhtsa_id=r.get("NHTSACampaignNumber"),
-                            campaign_number=r.get("NHTSACampaignNumber"),
-                            component=r.get("Component", ""),
-                            summary=r.get("Summary", ""),
-                            consequence=r.get("Conequence"),
-                            remedy=r.get("Remedy"),
-                            manufacturer=r.get("Manufacturer", ""),
-                            make=r.get("Make", ""),
-                            model=r.get("Model", ""),
-                            year=int(r["ModelYear"]) if r.get("ModelYear") else None,
-                            source="NHTSA",
-                        ))
+                    # Only the first 20 records are parsed; the rest of the stream is dropped
+                    results = self._iter_nhtsa_results("/recalls/recallsByComponent", {"component": "air bags"})
+                    self.recalls.extend([_make_recall(r) for r in islice(results, 20)])
                 except Exception as e:
                     logger.warning(f"NHTSA component recall fetch failed: {e}")
 
@@ -2,8 +2,8 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Callable, ClassVar, Iterable, Optional, Sequence
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SourceCategory(str, Enum):
@@ -15,9 +15,44 @@ class SourceCategory(str, Enum):
     TSB = "tsb"
 
 
+def _compile_columns(fields: tuple[str, ...]) -> Callable[[Iterable["_Record"]], dict[str, list]]:
+    """Generate a function that splits records into one list per field in a single pass.
+
+    The field names are unrolled into plain attribute reads, so the loop does no
+    getattr-by-name or schema lookups.
+    """
+    n = range(len(fields))
+    lines = ["def columns(items):"]
+    lines += [f"    c{k} = []; a{k} = c{k}.append" for k in n]
+    lines += ["    for i in items:"]
+    lines += [f"        a{k}(i.{f})" for k, f in zip(n, fields)]
+    lines += ["    return {" + ", ".join(f"{f!r}: c{k}" for k, f in zip(n, fields)) + "}"]
+    namespace: dict = {}
+    exec("\n".join(lines), namespace)
+    return namespace["columns"]
+
+
+class _Record(BaseModel):
+    """Base for pipeline records.
+
+    Core schemas are built when each class is defined (never deferred), so the first
+    model_construct/model_validate in a run pays no build cost. Instances are not
+    revalidated when passed back to model_validate; validate_sample dumps first.
+    """
+    model_config = ConfigDict(defer_build=False, revalidate_instances="never")
+
+    # columns(items) -> {field: [value, ...]}, generated per subclass for the exporter
+    columns: ClassVar[Callable[[Iterable["_Record"]], dict[str, list]]]
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.columns = staticmethod(_compile_columns(tuple(cls.model_fields)))
+
+
 # ─── OEM Maintenance Schedules ───
 
-class MaintenanceItem(BaseModel):
+class MaintenanceItem(_Record):
     """Single maintenance service item from OEM schedule."""
     vin: Optional[str] = None
     make: str
@@ -40,7 +75,7 @@ class MaintenanceItem(BaseModel):
 
 # ─── Dealer Repair Pricing ───
 
-class DealerPrice(BaseModel):
+class DealerPrice(_Record):
     """Dealer repair quote/pricing."""
     dealer_id: Optional[str] = None
     dealer_name: str
@@ -57,7 +92,7 @@ class DealerPrice(BaseModel):
 
 # ─── Labor Time Standards ───
 
-class LaborStandard(BaseModel):
+class LaborStandard(_Record):
     """Labor time standard for a repair operation."""
     operation: str
     labor_hours: float
@@ -69,7 +104,7 @@ class LaborStandard(BaseModel):
 
 # ─── Parts Pricing ───
 
-class PartsPrice(BaseModel):
+class PartsPrice(_Record):
     """Parts price from retailer/catalog."""
     part_number: Optional[str] = None
     part_name: str
@@ -82,7 +117,7 @@ class PartsPrice(BaseModel):
 
 # ─── Recalls & TSBs ───
 
-class Recall(BaseModel):
+class Recall(_Record):
     """NHTSA or manufacturer recall."""
     nhtsa_id: Optional[str] = None
     campaign_number: Optional[str] = None
@@ -99,7 +134,7 @@ class Recall(BaseModel):
     report_date: Optional[datetime] = None
 
 
-class TSB(BaseModel):
+class TSB(_Record):
     """Technical Service Bulletin."""
     tsb_number: str
     component: str
@@ -110,3 +145,14 @@ class TSB(BaseModel):
     year_range: Optional[str] = None
     source: str
     source_url: Optional[str] = None
+
+
+def validate_sample(items: Sequence[BaseModel]) -> None:
+    """Validate the first item of a batch built with model_construct.
+
+    Ingesters skip per-row validation for rows they normalized themselves; checking
+    one row per batch still surfaces a type mismatch as a ValidationError.
+    """
+    if items:
+        sample = items[0]
+        type(sample).model_validate(sample.model_dump())
@@ -9,17 +9,22 @@ Runs all 5 ingestion modules:
 5. Recalls + Known Issues
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
+from typing import get_args
 import sys
 
 # Ensure project root in path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-import pandas as pd
+import pyarrow as pa
 from loguru import logger
+from pyarrow import csv as pa_csv
+from pyarrow import parquet as pq
 
-from config.settings import PROCESSED_DIR, OUTPUT_DIR, load_sources_config
+from config.settings import EXPORT_CHUNK_ROWS, EXPORT_FORMAT, PROCESSED_DIR, OUTPUT_DIR, load_sources_config
 from src.ingesters import (
     OEMMaintenanceIngester,
     DealerPricingIngester,
@@ -27,6 +32,75 @@ from src.ingesters import (
     PartsPricingIngester,
     RecallsIngester,
 )
+from src.models import Recall
+
+EXPORT_FORMATS = ("feather", "parquet", "csv")
+
+# Rows per record batch when writing CSV
+CSV_BATCH_ROWS = 1000
+
+
+# Arrow type for each model field annotation (Optional[...] unwrapped)
+_ARROW_TYPES = {
+    str: pa.string(),
+    int: pa.int64(),
+    float: pa.float64(),
+    datetime: pa.timestamp("us"),
+    list[str]: pa.list_(pa.string()),
+}
+
+
+def _arrow_schema(model: type, flatten_lists: bool = False) -> pa.Schema:
+    """Fixed Arrow schema for a model, so chunks written separately share one schema."""
+    fields = []
+    for name, info in model.model_fields.items():
+        args = [a for a in get_args(info.annotation) if a is not type(None)]
+        arrow_type = _ARROW_TYPES[args[0] if args else info.annotation]
+        if flatten_lists and pa.types.is_list(arrow_type):
+            arrow_type = pa.string()
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+def _recall_csv_columns(items: list[Recall]) -> dict[str, list]:
+    """Recall columns with vin_scope flattened to "VIN1;VIN2" for CSV."""
+    columns = Recall.columns(items)
+    columns["vin_scope"] = [";".join(vins) if vins else None for vins in columns["vin_scope"]]
+    return columns
+
+
+# Modules whose CSV needs more than Model.columns(items), keyed by result name
+_CSV_COLUMNS = {
+    "recalls": _recall_csv_columns,
+}
+
+
+def _open_writer(fmt: str, out_path: Path, schema: pa.Schema):
+    """Incremental pyarrow writer for one export file."""
+    if fmt == "csv":
+        return pa_csv.CSVWriter(out_path, schema, write_options=pa_csv.WriteOptions(batch_size=CSV_BATCH_ROWS))
+    if fmt == "feather":
+        # Feather V2 is the Arrow IPC file format; lz4 matches to_feather's default
+        return pa.ipc.new_file(out_path, schema, options=pa.ipc.IpcWriteOptions(compression="lz4"))
+    return pq.ParquetWriter(out_path, schema, compression="zstd")
+
+
+def _export_one(name: str, items: list, fmt: str, out_dir: Path) -> Path:
+    """Write one module's records to out_dir as <name>_data.<fmt>.
+
+    Every file is written against the model's _arrow_schema, so column types never
+    depend on the data or on the record count. Records go out EXPORT_CHUNK_ROWS at a
+    time: only one chunk's columns are alive at once, and a short list is one write.
+    """
+    out_path = out_dir / f"{name}_data.{fmt}"
+    model = type(items[0])
+    schema = _arrow_schema(model, flatten_lists=fmt == "csv")
+    to_columns = (_CSV_COLUMNS.get(name) if fmt == "csv" else None) or model.columns
+    with _open_writer(fmt, out_path, schema) as writer:
+        for start in range(0, len(items), EXPORT_CHUNK_ROWS):
+            chunk = items[start:start + EXPORT_CHUNK_ROWS]
+            writer.write_table(pa.Table.from_pydict(to_columns(chunk), schema=schema))
+    return out_path
 
 
 def run_pipeline(
@@ -39,6 +113,7 @@ def run_pipeline(
     skip_labor: bool = False,
     skip_parts: bool = False,
     skip_recalls: bool = False,
+    export_format: str | None = None,
 ) -> dict:
     """
     Run the full data ingestion pipeline.
@@ -49,10 +124,15 @@ def run_pipeline(
         dealer_urls: Optional [(url, dealer_name)] for dealer pricing
         parts_queries: Optional part names for parts pricing
         skip_*: Skip individual ingestion modules
+        export_format: "feather", "parquet" or "csv" (default from FAIRFIX_EXPORT_FMT)
 
     Returns:
         Dict with keys: oem, dealer, labor, parts, recalls
     """
+    export_format = export_format or EXPORT_FORMAT
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {export_format!r}; expected one of {EXPORT_FORMATS}")
+
     logger.info("Starting Auto Maintenance Data Pipeline")
 
     results = {
@@ -63,33 +143,32 @@ def run_pipeline(
         "recalls": [],
     }
 
+    # The modules share no data, so run the enabled ones side by side (each is mostly
+    # waiting on the network); wall time becomes the slowest module, not the sum.
+    tasks = {}
     if not skip_oem:
-        oem = OEMMaintenanceIngester()
-        results["oem"] = oem.run()
-
+        tasks["oem"] = lambda: OEMMaintenanceIngester().run()
     if not skip_dealer:
-        dealer = DealerPricingIngester()
-        results["dealer"] = dealer.run(dealer_urls=dealer_urls)
-
+        tasks["dealer"] = lambda: DealerPricingIngester().run(dealer_urls=dealer_urls)
     if not skip_labor:
-        labor = LaborStandardsIngester()
-        results["labor"] = labor.run()
-
+        tasks["labor"] = lambda: LaborStandardsIngester().run()
     if not skip_parts:
-        parts = PartsPricingIngester()
-        results["parts"] = parts.run(search_queries=parts_queries)
-
+        tasks["parts"] = lambda: PartsPricingIngester().run(search_queries=parts_queries)
     if not skip_recalls:
-        recalls_ing = RecallsIngester()
-        recalls_list, _ = recalls_ing.run(vins=vins, vehicles=vehicles)
-        results["recalls"] = recalls_list
+        tasks["recalls"] = lambda: RecallsIngester().run(vins=vins, vehicles=vehicles)[0]
+
+    if tasks:
+        with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+            futures = {pool.submit(fn): name for name, fn in tasks.items()}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
 
-    # Export to CSV
+    # Export (Feather by default; CSV only when asked for). Files are written one after
+    # another: the work is GIL-bound column building, and a thread pool measured slower.
+    out_dir = OUTPUT_DIR.resolve()
     for name, items in results.items():
         if items:
-            df = pd.DataFrame([i.model_dump() if hasattr(i, "model_dump") else dict(i) for i in items])
-            out_path = OUTPUT_DIR / f"{name}_data.csv"
-            df.to_csv(out_path, index=False)
+            out_path = _export_one(name, items, export_format, out_dir)
             logger.info(f"Exported {len(items)} {name} records to {out_path}")
 
     return results